@@ -5,8 +5,83 @@
 
 from roboticstoolbox import DHRobot, RevoluteDH
 from math import pi
+from functools import lru_cache
 import numpy as np
 
+# robot length values (metres)
+_d1 = 0.352
+_a1 = 0.070
+_a2 = 0.360
+_d4 = 0.380
+_d6 = 0.065
+
+# Kinematic parameters, one row per link: d, a, alpha
+# Updated values form ARTE git. Old values left as comments
+_dh = np.array([
+    [_d1, _a1, -pi/2],
+    [0, _a2, 0],
+    [0, 0, -pi/2],    # alpha=pi/2
+    [_d4, 0, pi/2],    # alpha=-pi/2
+    [0, 0, -pi/2],    # alpha=pi/2
+    [_d6, 0, 0],       # alpha=pi/2
+])
+
+# Joint limits, one row per link
+_qlim = np.deg2rad([
+    [-180, 180],
+    [-100, 100],
+    [-220, 60],
+    [-200, 200],
+    [-120, 120],
+    [-400, 400],
+])
+
+# Named joint configurations, read-only since they are shared.
+# addconfiguration stores a copy on each instance.
+_qz = np.zeros(6)
+_qd = np.deg2rad([0, -90, 180, 0, 0, -90])
+_qr = np.deg2rad([0, -90, 90, 0, 90, -90])
+_qz.setflags(write=False)
+_qd.setflags(write=False)
+_qr.setflags(write=False)
+
+# Link centre of mass (m) and inertia (kg.m^2) for the first three links,
+# the ARTE source gives these in mm and kg.mm^2.  Read-only since they are
+# shared by all instances, Link keeps a reference to the inertia matrix.
+_r1 = np.array([27.87, 43.12, -89.03]) * 1e-3
+_r2 = np.array([198.29, 9.73, 92.43]) * 1e-3
+_r3 = np.array([-4.56, -79.96, -5.86]) * 1e-3
+
+_I1 = np.array([
+    [512052539.74, 1361335.88, 51305020.72],
+    [1361335.88, 464074688.59, 70335556.04],
+    [51305020.72, 70335556.04, 462745526.12]]) * 1e-9
+_I2 = np.array([
+    [94817914.40, -3859712.77, 37932017.01],
+    [-3859712.77, 328604163.24, -1088970.86],
+    [37932017.01, -1088970.86, 277463004.88]]) * 1e-9
+_I3 = np.array([
+    [500060915.95, -1863252.17, 934875.78],
+    [-1863252.17, 75152670.69, -15204130.09],
+    [934875.78, -15204130.09, 515424754.34]]) * 1e-9
+
+_r1.setflags(write=False)
+_r2.setflags(write=False)
+_r3.setflags(write=False)
+_I1.setflags(write=False)
+_I2.setflags(write=False)
+_I3.setflags(write=False)
+
+# Dynamic parameters, one dict per link, only known for the first three
+_dyn = [
+    dict(m=34655.36e-3, r=_r1, I=_I1),
+    dict(m=15994.59e-3, r=_r2, I=_I2),
+    dict(m=20862.05e-3, r=_r3, I=_I3),
+    {},
+    {},
+    {},
+]
+
 
 class IRB140(DHRobot):
     """
@@ -40,75 +115,11 @@ class IRB140(DHRobot):
     .. codeauthor:: Peter Corke
     """  # noqa
     def __init__(self):
-        deg = pi/180
-
-        # robot length values (metres)
-        d1 = 0.352
-        a1 = 0.070
-        a2 = 0.360
-        d4 = 0.380
-        d6 = 0.065
 
         # Create Links
-        # Updated values form ARTE git. Old values left as comments
-
         L = [
-            RevoluteDH(
-                d=d1,
-                a=a1,
-                alpha=-pi/2,
-                m=34655.36e-3,
-                r=np.array([27.87, 43.12, -89.03])*1e-3,
-                I=np.array([512052539.74, 1361335.88, 51305020.72,
-                            1361335.88, 464074688.59, 70335556.04,
-                            51305020.72, 70335556.04, 462745526.12])*1e-9,
-                qlim=[-180 * deg, 180 * deg]
-            ),
-
-            RevoluteDH(
-                d=0,
-                a=a2,
-                alpha=0,
-                m=15994.59e-3,
-                r=np.array([198.29, 9.73, 92.43])*1e03,
-                I=np.array([94817914.40, -3859712.77, 37932017.01,
-                            -3859712.77, 328604163.24, -1088970.86,
-                            37932017.01, -1088970.86, 277463004.88])*1e-9,
-                qlim=[-100 * deg, 100 * deg]
-            ),
-
-            RevoluteDH(
-                d=0,
-                a=0,
-                alpha=-pi/2,  # alpha=pi/2,
-                m=20862.05e-3,
-                r=np.array([-4.56, -79.96, -5.86]),
-                I=np.array([500060915.95, -1863252.17, 934875.78,
-                            -1863252.17, 75152670.69, -15204130.09,
-                            934875.78, -15204130.09, 515424754.34])*1e-9,
-                qlim=[-220 * deg, 60 * deg]
-            ),
-
-            RevoluteDH(
-                d=d4,
-                a=0,
-                alpha=pi/2,  # alpha=-pi/2,
-                qlim=[-200 * deg, 200 * deg]
-            ),
-
-            RevoluteDH(
-                d=0,
-                a=0,
-                alpha=-pi/2,  # alpha=pi/2,
-                qlim=[-120 * deg, 120 * deg]
-            ),
-
-            RevoluteDH(
-                d=d6,
-                a=0,
-                alpha=0,  # alpha=pi/2,
-                qlim=[-400 * deg, 400 * deg]
-            )
+            RevoluteDH(d=d, a=a, alpha=alpha, qlim=qlim, **dyn)
+            for (d, a, alpha), qlim, dyn in zip(_dh, _qlim, _dyn)
         ]
 
         super().__init__(
@@ -118,9 +129,29 @@ class IRB140(DHRobot):
             manufacturer='ABB',
             meshdir="meshes/ABB/IRB140")
 
-        self.addconfiguration("qz", [0, 0, 0, 0, 0, 0])
-        self.addconfiguration("qd", [0, -90*deg, 180*deg, 0, 0, -90*deg])
-        self.addconfiguration("qr", [0, -90*deg, 90*deg, 0, 90*deg, -90*deg])
+        self.addconfiguration("qz", _qz)
+        self.addconfiguration("qd", _qd)
+        self.addconfiguration("qr", _qr)
+
+
+@lru_cache(maxsize=1)
+def get_irb140():
+    """
+    Shared instance of the IRB140 model
+
+    :return: IRB140 robot model
+    :rtype: IRB140 instance
+
+    ``get_irb140()`` creates an ``IRB140()`` on the first call, subsequent
+    calls return the same instance.
+
+    .. warning:: The instance is shared by all callers and should be treated
+        as read-only.  Create an ``IRB140()`` if you need to change its state,
+        for example its joint configuration, base or tool.
+
+    :seealso: :class:`IRB140`
+    """
+    return IRB140()
 
 
 if __name__ == '__main__':   # pragma nocover
@@ -5,7 +5,7 @@ from roboticstoolbox.models.DH.Ball import Ball
 from roboticstoolbox.models.DH.Hyper import Hyper
 from roboticstoolbox.models.DH.Coil import Coil
 from roboticstoolbox.models.DH.Cobra600 import Cobra600
-from roboticstoolbox.models.DH.IRB140 import IRB140
+from roboticstoolbox.models.DH.IRB140 import IRB140, get_irb140
 from roboticstoolbox.models.DH.KR5 import KR5
 from roboticstoolbox.models.DH.Orion5 import Orion5
 from roboticstoolbox.models.DH.Planar3 import Planar3
@@ -33,6 +33,7 @@ __all__ = [
     'Hyper3d',
     'Cobra600',
     'IRB140',
+    'get_irb140',
     'KR5',
     'Orion5',
     'Planar3',
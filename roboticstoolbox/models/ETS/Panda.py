@@ -1,10 +1,47 @@
 #!/usr/bin/env python
 
 import numpy as np
+from functools import lru_cache
 from roboticstoolbox.robot.ETS import ETS
 from roboticstoolbox.robot.ERobot import ERobot
 from roboticstoolbox.robot.ELink import ELink
 
+_mm = 1e-3
+
+# Constant parts of the link ETSs, as (link name, ETs) pairs in order from
+# the base, each ET given as (axis, value).  Only these numbers are shared,
+# every instance builds its own ETs from them, so changing an ET of one
+# robot does not affect another.  The link twists are all right angles and
+# are given directly in radians.
+_links = (
+    ('link0', (('tz', 0.333),)),
+    ('link1', (('rx', -np.pi/2),)),
+    ('link2', (('rx', np.pi/2), ('tz', 0.316))),
+    ('link3', (('tx', 0.0825), ('rx', np.pi/2))),
+    ('link4', (('tx', -0.0825), ('rx', -np.pi/2), ('tz', 0.384))),
+    ('link5', (('rx', np.pi/2),)),
+    ('link6', (('tx', 0.088), ('rx', np.pi/2), ('tz', 0.107))),
+)
+
+# Tool transform, the flange to the centre of the fingertips
+_tool = (('tz', 103*_mm), ('rz', -np.pi/4))
+
+
+def _ets(segment):
+    # build a new ETS from (axis, value) pairs
+    ets = ETS()
+    for axis, eta in segment:
+        ets *= getattr(ETS, axis)(eta)
+    return ets
+
+
+# Named joint configurations, read-only since they are shared.
+# addconfiguration stores a copy on each instance.
+_qz = np.zeros(7)
+_qr = np.array([0, -0.3, 0, -2.2, 0, 2.0, np.pi/4])
+_qz.setflags(write=False)
+_qr.setflags(write=False)
+
 
 class Panda(ERobot):
     """
@@ -24,69 +61,48 @@ class Panda(ERobot):
     """
     def __init__(self):
 
-        deg = np.pi/180
-        mm = 1e-3
-        tool_offset = (103)*mm
-
-        l0 = ELink(
-            ETS.tz(0.333) * ETS.rz(),
-            name='link0',
-            parent=None
-        )
-
-        l1 = ELink(
-            ETS.rx(-90*deg) * ETS.rz(),
-            name='link1',
-            parent=l0
-        )
-
-        l2 = ELink(
-            ETS.rx(90*deg) * ETS.tz(0.316) * ETS.rz(),
-            name='link2',
-            parent=l1
-        )
-
-        l3 = ELink(
-            ETS.tx(0.0825) * ETS.rx(90, 'deg') * ETS.rz(),
-            name='link3',
-            parent=l2
-        )
-
-        l4 = ELink(
-            ETS.tx(-0.0825) * ETS.rx(-90, 'deg') * ETS.tz(0.384) * ETS.rz(),
-            name='link4',
-            parent=l3
-        )
-
-        l5 = ELink(
-            ETS.rx(90, 'deg') * ETS.rz(),
-            name='link5',
-            parent=l4
-        )
-
-        l6 = ELink(
-            ETS.tx(0.088) * ETS.rx(90, 'deg') * ETS.tz(0.107) * ETS.rz(),
-            name='link6',
-            parent=l5
-        )
+        elinks = []
+        parent = None
+        for name, segment in _links:
+            parent = ELink(
+                _ets(segment) * ETS.rz(), name=name, parent=parent)
+            elinks.append(parent)
 
         ee = ELink(
-            ETS.tz(tool_offset) * ETS.rz(-np.pi/4),
+            _ets(_tool),
             name='ee',
-            parent=l6
+            parent=parent
         )
-
-        elinks = [l0, l1, l2, l3, l4, l5, l6, ee]
+        elinks.append(ee)
 
         super(Panda, self).__init__(
             elinks,
             name='Panda',
             manufacturer='Franka Emika')
 
-        self.addconfiguration(
-            "qz", np.array([0, 0, 0, 0, 0, 0, 0]))
-        self.addconfiguration(
-            "qr", np.array([0, -0.3, 0, -2.2, 0, 2.0, np.pi/4]))
+        self.addconfiguration("qz", _qz)
+        self.addconfiguration("qr", _qr)
+
+
+@lru_cache(maxsize=1)
+def get_panda():
+    """
+    Shared instance of the Panda model
+
+    :return: Panda robot model
+    :rtype: Panda instance
+
+    ``get_panda()`` creates a ``Panda()`` on the first call, subsequent calls
+    return the same instance.  Useful where the model is needed repeatedly,
+    for example once per planning query or learning episode.
+
+    .. warning:: The instance is shared by all callers and should be treated
+        as read-only.  Create a ``Panda()`` if you need to change its state,
+        for example its joint configuration, base or tool.
+
+    :seealso: :class:`Panda`
+    """
+    return Panda()
 
 
 if __name__ == '__main__':   # pragma nocover
@@ -1,4 +1,4 @@
-from roboticstoolbox.models.ETS.Panda import Panda
+from roboticstoolbox.models.ETS.Panda import Panda, get_panda
 from roboticstoolbox.models.ETS.Frankie import Frankie
 from roboticstoolbox.models.ETS.Puma560 import Puma560
 from roboticstoolbox.models.ETS.Planar_Y import Planar_Y
@@ -8,6 +8,7 @@ from roboticstoolbox.models.ETS.GenericSeven import GenericSeven
 
 __all__ = [
     'Panda',
+    'get_panda',
     'Frankie',
     'Puma560',
     'Planar_Y',
@@ -3,18 +3,535 @@
 @author: Jesse Haviland
 @author: Peter Corke
 """
-from collections import UserList
+from collections import UserList, OrderedDict
+from functools import lru_cache
 from types import SimpleNamespace
 import copy
+import inspect
+import math
 from abc import ABC
 import numpy as np
 from spatialmath import SE3, SE2
 from spatialmath.base import getvector, getunit, trotx, troty, trotz, \
-    issymbol, tr2jac, transl2, trot2, removesmall, trinv, trinv2, \
-    verifymatrix, iseye, tr2jac2
+    issymbol, tr2jac, trot2, removesmall, trinv, trinv2, \
+    verifymatrix, iseye, tr2jac2, simplify, symbol
+
+_numba = False
+try:
+    from numba import njit, prange
+    _numba = True
+except ImportError:    # pragma nocover
+    prange = range
+
+# integer identifiers for the axis of an ET, each ET stores its own as
+# axis_id.  They are also the codes used by the packed (structure of arrays)
+# form of an ETS
+AXIS_RX = 0
+AXIS_RY = 1
+AXIS_RZ = 2
+AXIS_TX = 3
+AXIS_TY = 4
+AXIS_TZ = 5
+AXIS_C = 6
+
+_AXIS_ID = {
+    'Rx': AXIS_RX, 'Ry': AXIS_RY, 'Rz': AXIS_RZ,
+    'tx': AXIS_TX, 'ty': AXIS_TY, 'tz': AXIS_TZ,
+    'R': AXIS_RZ,  # 2D rotation is about the z-axis
+    'C': AXIS_C}
+
+# columns (a, b) of T mixed by a rotation about x, y, z
+_ROT_COLS = ((1, 2), (2, 0), (0, 1))
+
+# the same as lookup tables indexed by axis code, for the jitted kernels
+_ROT_A = np.array([a for a, b in _ROT_COLS], dtype=np.int64)
+_ROT_B = np.array([b for a, b in _ROT_COLS], dtype=np.int64)
+
+
+# In-place updates T = T @ E(q) for each elementary transform E, where T is
+# an SE(3) matrix.  A rotation only mixes two columns of T and a translation
+# only changes its last column, so there is no 4x4 product or temporary.
+# Rotations are given the cosine and sine of the angle, so they can be
+# shared.
+
+def _rotate_x(T, c, s):
+    for r in range(3):
+        y = T[r, 1]
+        z = T[r, 2]
+        T[r, 1] = c * y + s * z
+        T[r, 2] = c * z - s * y
+
+
+def _rotate_y(T, c, s):
+    for r in range(3):
+        x = T[r, 0]
+        z = T[r, 2]
+        T[r, 0] = c * x - s * z
+        T[r, 2] = c * z + s * x
+
+
+def _rotate_z(T, c, s):
+    for r in range(3):
+        x = T[r, 0]
+        y = T[r, 1]
+        T[r, 0] = c * x + s * y
+        T[r, 1] = c * y - s * x
+
+
+def _translate_x(T, q):
+    for r in range(3):
+        T[r, 3] += q * T[r, 0]
+
+
+def _translate_y(T, q):
+    for r in range(3):
+        T[r, 3] += q * T[r, 1]
+
+
+def _translate_z(T, q):
+    for r in range(3):
+        T[r, 3] += q * T[r, 2]
+
+
+def _compose(T, C):
+    # T = T @ C in place for SE(3) matrices, the bottom rows are [0 0 0 1]
+    # so only the rotation and translation of T change
+    for r in range(3):
+        a0 = T[r, 0]
+        a1 = T[r, 1]
+        a2 = T[r, 2]
+        for k in range(3):
+            T[r, k] = a0 * C[0, k] + a1 * C[1, k] + a2 * C[2, k]
+        T[r, 3] += a0 * C[0, 3] + a1 * C[1, 3] + a2 * C[2, 3]
+
+
+def _update(T, code, q):
+    # update for any axis code, the columns changed are looked up rather
+    # than dispatching on each axis
+    if code <= AXIS_RZ:
+        c = math.cos(q)
+        s = math.sin(q)
+        a = _ROT_A[code]
+        b = _ROT_B[code]
+        for r in range(3):
+            ta = T[r, a]
+            tb = T[r, b]
+            T[r, a] = c * ta + s * tb
+            T[r, b] = c * tb - s * ta
+    else:
+        k = code - AXIS_TX
+        for r in range(3):
+            T[r, 3] += q * T[r, k]
+
+
+# updaters indexed by axis_id
+_UPDATE = (
+    _rotate_x, _rotate_y, _rotate_z,
+    _translate_x, _translate_y, _translate_z)
+
+
+# count of in-place changes to ET namespaces, which can be shared by
+# several ETS.  Each namespace also has its own version, so an ETS only
+# checks its ETs when this has moved, see BaseETS._refresh()
+_generation = 0
+
+
+def _modified(et):
+    # note that the ET namespace et was changed in place
+    global _generation
+    et.version += 1
+    _generation += 1
+
+
+def _same(a, b):
+    # True if a and b are the same value, including symbols, for values
+    # that cannot be compared such as arrays assume not
+    if a is b:
+        return True
+    try:
+        return bool(a == b)
+    except (TypeError, ValueError):
+        return False
+
+
+_I4 = np.eye(4)
+_I3 = np.eye(3)
+
+
+def _transl(T, i, d):
+    # elementary translation by d along axis i, T is the identity matrix
+    # to use, it is copied.  Symbolic values need an object array
+    if issymbol(d):
+        T = np.identity(T.shape[0], dtype='O')
+    else:
+        T = T.copy()
+    T[i, -1] = d
+    return T
+
+
+# Write the rotational part of an elementary rotation into out, an SE(3)
+# matrix which is otherwise identity.  This avoids building a new array
+# from a nested list as trotx() etc. do.
+
+def _fast_rx(q, out):
+    c = math.cos(q)
+    s = math.sin(q)
+    out[1, 1] = c
+    out[1, 2] = -s
+    out[2, 1] = s
+    out[2, 2] = c
+    return out
+
+
+def _fast_ry(q, out):
+    c = math.cos(q)
+    s = math.sin(q)
+    out[0, 0] = c
+    out[0, 2] = s
+    out[2, 0] = -s
+    out[2, 2] = c
+    return out
+
+
+def _fast_rz(q, out):
+    c = math.cos(q)
+    s = math.sin(q)
+    out[0, 0] = c
+    out[0, 1] = -s
+    out[1, 0] = s
+    out[1, 1] = c
+    return out
+
+
+def _fk_kernel(codes, jindex, sign, consts, q, scale):
+    # evaluate a packed ETS, see ETS._pack(), rotational joint values are
+    # multiplied by scale
+    T = np.empty((4, 4))
+    _fk_into(codes, jindex, sign, consts, q, scale, T)
+    return T
+
+
+def _fk_batch_kernel(codes, jindex, sign, consts, Q, scale, T):
+    # evaluate a packed ETS for each row of Q, in parallel, the results are
+    # written into T of shape (B,4,4) whose dtype may differ from float64
+    B = Q.shape[0]
+    for b in prange(B):
+        _fk_into(codes, jindex, sign, consts, Q[b], scale, T[b])
+    return T
+
+
+def _fk_into(codes, jindex, sign, consts, q, scale, T):
+    # as for _fk_kernel but the result is written into T.  A leading
+    # constant is the initial value
+    start = 0
+    k = 0
+    if codes.shape[0] > 0 and codes[0] == AXIS_C:
+        T[:, :] = consts[0]
+        start = 1
+        k = 1
+    else:
+        T[:, :] = 0
+        for r in range(4):
+            T[r, r] = 1
+    for i in range(start, codes.shape[0]):
+        code = codes[i]
+        if code == AXIS_C:
+            _compose(T, consts[k])
+            k += 1
+            continue
+        x = sign[i] * q[jindex[i]]
+        if code <= AXIS_RZ:
+            x *= scale
+        _update(T, code, x)
+
+
+def _fk2_kernel(codes, jindex, sign, consts, q, scale):
+    # as for _fk_kernel but for a packed ETS2
+    T = np.empty((3, 3))
+    _fk2_into(codes, jindex, sign, consts, q, scale, T)
+    return T
+
+
+def _fk2_batch_kernel(codes, jindex, sign, consts, Q, scale, T):
+    # as for _fk_batch_kernel but for a packed ETS2, T is (B,3,3)
+    B = Q.shape[0]
+    for b in prange(B):
+        _fk2_into(codes, jindex, sign, consts, Q[b], scale, T[b])
+
+
+def _fk2_into(codes, jindex, sign, consts, q, scale, T):
+    # as for _fk_into but for a packed ETS2, T is an SE(2) matrix.  The
+    # rotations are about z and mix columns 0 and 1, the translation is
+    # column 2
+    start = 0
+    k = 0
+    if codes.shape[0] > 0 and codes[0] == AXIS_C:
+        T[:, :] = consts[0]
+        start = 1
+        k = 1
+    else:
+        T[:, :] = 0
+        for r in range(3):
+            T[r, r] = 1
+    for i in range(start, codes.shape[0]):
+        code = codes[i]
+        if code == AXIS_C:
+            C = consts[k]
+            k += 1
+            for r in range(2):
+                a0 = T[r, 0]
+                a1 = T[r, 1]
+                T[r, 0] = a0 * C[0, 0] + a1 * C[1, 0]
+                T[r, 1] = a0 * C[0, 1] + a1 * C[1, 1]
+                T[r, 2] += a0 * C[0, 2] + a1 * C[1, 2]
+            continue
+        x = sign[i] * q[jindex[i]]
+        if code == AXIS_RZ:
+            x *= scale
+            c = math.cos(x)
+            s = math.sin(x)
+            for r in range(2):
+                ta = T[r, 0]
+                tb = T[r, 1]
+                T[r, 0] = c * ta + s * tb
+                T[r, 1] = c * tb - s * ta
+        else:
+            m = code - AXIS_TX
+            for r in range(2):
+                T[r, 2] += x * T[r, m]
+
+
+def _jacob0_column(J, U, T, code, j, f, p):
+    # accumulate into column j of J the contribution of a joint with frame
+    # U about or along axis code, T is the end-effector pose and p is
+    # scratch.  The column is negated for a flipped joint, f = -1
+    if code > AXIS_RZ:
+        # translation, the joint axis is a column of U
+        c = code - AXIS_TX
+        for r in range(3):
+            J[r, j] += f * U[r, c]
+        return
+
+    # end-effector position with respect to the joint frame
+    px = T[0, 3] - U[0, 3]
+    py = T[1, 3] - U[1, 3]
+    pz = T[2, 3] - U[2, 3]
+    for c in range(3):
+        p[c] = U[0, c] * px + U[1, c] * py + U[2, c] * pz
+
+    # rotation about column c of U, the linear velocity is the cross
+    # product of that axis with the position, (a, b, c) is a cyclic
+    # permutation of (0, 1, 2)
+    a = _ROT_A[code]
+    b = _ROT_B[code]
+    pa = p[a]
+    pb = p[b]
+    for r in range(3):
+        J[r, j] += f * (U[r, b] * pa - U[r, a] * pb)
+        J[r + 3, j] += f * U[r, code]
+
+
+def _jacob0_kernel(codes, jindex, sign, consts, q, T):
+    # base frame Jacobian of a packed ETS, see ETS._pack(), T is the
+    # end-effector pose
+    J = np.zeros((6, q.shape[0]))
+    p = np.empty(3)
+    start = 0
+    k = 0
+    if codes.shape[0] > 0 and codes[0] == AXIS_C:
+        U = consts[0].copy()
+        start = 1
+        k = 1
+    else:
+        U = np.eye(4)
+    for i in range(start, codes.shape[0]):
+        code = codes[i]
+        if code == AXIS_C:
+            _compose(U, consts[k])
+            k += 1
+            continue
+        j = jindex[i]
+        _update(U, code, sign[i] * q[j])
+        _jacob0_column(J, U, T, code, j, sign[i], p)
+    return J
+
+
+def _jacob0_fused_kernel(codes, jindex, sign, consts, q):
+    # pose and base frame Jacobian of a packed ETS in one walk of the
+    # chain.  The frame of each joint is kept in a stack, the columns are
+    # formed once the end-effector pose is known
+    J = np.zeros((6, q.shape[0]))
+    p = np.empty(3)
+    frames = np.empty((codes.shape[0], 4, 4))
+    start = 0
+    k = 0
+    if codes.shape[0] > 0 and codes[0] == AXIS_C:
+        U = consts[0].copy()
+        start = 1
+        k = 1
+    else:
+        U = np.eye(4)
+    for i in range(start, codes.shape[0]):
+        code = codes[i]
+        if code == AXIS_C:
+            _compose(U, consts[k])
+            k += 1
+            continue
+        _update(U, code, sign[i] * q[jindex[i]])
+        frames[i] = U
+    for i in range(start, codes.shape[0]):
+        code = codes[i]
+        if code != AXIS_C:
+            _jacob0_column(J, frames[i], U, code, jindex[i], sign[i], p)
+    return U, J
+
+if _numba:
+    _rotate_x = njit(cache=True, fastmath=True)(_rotate_x)
+    _rotate_y = njit(cache=True, fastmath=True)(_rotate_y)
+    _rotate_z = njit(cache=True, fastmath=True)(_rotate_z)
+    _translate_x = njit(cache=True, fastmath=True)(_translate_x)
+    _translate_y = njit(cache=True, fastmath=True)(_translate_y)
+    _translate_z = njit(cache=True, fastmath=True)(_translate_z)
+    _compose = njit(cache=True, fastmath=True)(_compose)
+    _update = njit(cache=True, fastmath=True)(_update)
+    _fk_into = njit(cache=True, fastmath=True)(_fk_into)
+    _fk_kernel = njit(cache=True, fastmath=True)(_fk_kernel)
+    _fk_batch_kernel = njit(
+        cache=True, fastmath=True, parallel=True)(_fk_batch_kernel)
+    _fk2_into = njit(cache=True, fastmath=True)(_fk2_into)
+    _fk2_kernel = njit(cache=True, fastmath=True)(_fk2_kernel)
+    _fk2_batch_kernel = njit(
+        cache=True, fastmath=True, parallel=True)(_fk2_batch_kernel)
+    _jacob0_column = njit(cache=True, fastmath=True)(_jacob0_column)
+    _jacob0_kernel = njit(cache=True, fastmath=True)(_jacob0_kernel)
+    _jacob0_fused_kernel = njit(
+        cache=True, fastmath=True)(_jacob0_fused_kernel)
+
+
+def _fk_source(unit, signature, name='fk'):
+    # generate the source of a forward kinematic function for an ETS
+    # signature, see ETS._signature.  Returns the source, the constants it
+    # refers to by name and the updaters it calls
+    lines = []
+    consts = {}
+    nconst = 0
+    updaters = []
+    trig = []  # cosine and sine of the joint coordinates
+    cs = {}  # joint coordinate index to names of its cos and sin
+
+    for term in signature:
+        if isinstance(term, bytes):
+            # folded constant
+            cname = f"C{nconst}"
+            nconst += 1
+            consts[cname] = np.frombuffer(term).reshape(4, 4)
+            if len(lines) == 0:
+                # copy, don't return the captured matrix itself
+                lines.append(f"T = {cname}.copy()")
+            else:
+                lines.append(f"T = T @ {cname}")
+            continue
+
+        axis_id, k, flip = term
+        if len(lines) == 0:
+            # copying a stored identity is much cheaper than eye(4)
+            consts["I4"] = _I4
+            lines.append("T = I4.copy()")
+        update = _UPDATE[axis_id]
+        if update not in updaters:
+            updaters.append(update)
+
+        if axis_id <= AXIS_RZ:
+            if k not in cs:
+                qk = f"q[{k}]"
+                if unit == 'deg':
+                    qk = f"{qk} * {math.pi / 180!r}"
+                cs[k] = (f"c{k}", f"s{k}")
+                trig.append(f"c{k} = cos({qk})")
+                trig.append(f"s{k} = sin({qk})")
+            c, s = cs[k]
+            if flip:
+                # cos(-q) = cos(q), sin(-q) = -sin(q)
+                s = "-" + s
+            lines.append(f"{update.__name__}(T, {c}, {s})")
+        else:
+            qk = f"q[{k}]"
+            if flip:
+                qk = "-" + qk
+            lines.append(f"{update.__name__}(T, {qk})")
+
+    if len(lines) == 0:
+        # all constants that fold to identity
+        lines.append("T = eye(4)")
+    lines.append("return T")
+
+    src = f"def {name}(q):\n    " + "\n    ".join(trig + lines) + "\n"
+    return src, consts, updaters
+
+
+@lru_cache(maxsize=64)
+def _compile_fk(unit, signature):
+    # compile the forward kinematic function for an ETS signature
+    src, consts, updaters = _fk_source(unit, signature)
+    namespace = dict(consts, eye=np.eye, cos=math.cos, sin=math.sin)
+    namespace.update({f.__name__: f for f in updaters})
+    exec(src, namespace)
+    return namespace['fk']
+
+
+_jax_fk = None
+
+
+def _jax_kernel():
+    # build the jitted JAX forward kinematics on first use, JAX is an
+    # optional dependency.  It scans over the steps of a packed ETS, see
+    # ETS._pack(), C holds the constant for each step
+    global _jax_fk
+    if _jax_fk is None:
+        import jax
+        import jax.numpy as jnp
+
+        def rotate(a, b):
+            def f(T, x, C):
+                c = jnp.cos(x)
+                s = jnp.sin(x)
+                Ta = T[:, a]
+                Tb = T[:, b]
+                return T.at[:, a].set(c * Ta + s * Tb) \
+                    .at[:, b].set(c * Tb - s * Ta)
+            return f
+
+        def translate(i):
+            def f(T, x, C):
+                return T.at[:, 3].add(x * T[:, i])
+            return f
+
+        def compose(T, x, C):
+            return T @ C
+
+        # indexed by axis code
+        branches = [rotate(a, b) for a, b in _ROT_COLS] \
+            + [translate(i) for i in range(3)] + [compose]
+
+        def step(T, xs):
+            code, x, C = xs
+            return jax.lax.switch(code, branches, T, x, C), None
+
+        @jax.jit
+        def fk(codes, jindex, sign, C, q):
+            x = sign * q[jindex]
+            T, _ = jax.lax.scan(step, jnp.eye(4, dtype=x.dtype), (codes, x, C))
+            return T
+
+        _jax_fk = fk
+    return _jax_fk
+
 
 class BaseETS(UserList, ABC):
 
+    # number of results remembered by eval()
+    _eval_cache_size = 4
+
     # T is a NumPy array (4,4) or None
     # ets_tuple = namedtuple('ETS3', 'eta axis_func axis joint T jindex flip')
 
@@ -147,7 +664,9 @@ class BaseETS(UserList, ABC):
         # Save all the params in a named tuple
         e = SimpleNamespace(
             eta=eta, axis_func=axis_func,
-            axis=axis, joint=joint, T=T, jindex=j, flip=flip, qlim=qlim)
+            axis=axis, axis_id=_AXIS_ID[axis],
+            joint=joint, T=T, jindex=j, flip=flip, qlim=qlim,
+            last_q=None, last_T=None, version=0)
 
         # And make it the only value of this instance
         self.data = [e]
@@ -187,8 +706,18 @@ class BaseETS(UserList, ABC):
 
         .. note:: No unit conversions are applied, it is assumed to be in
             radians.
+
+        For a constant ET the transform, which is computed once when the ET
+        is created, is updated to the new value.
         """
-        self.data[0].eta = value
+        et = self.data[0]
+        if _same(et.eta, value):
+            return
+        et.eta = value
+        if not et.joint and value is not None and et.axis_func is not None:
+            et.T = et.axis_func(value)
+        _modified(et)
+        self._invalidate()
 
     @property
     def axis_func(self):
@@ -215,6 +744,75 @@ class BaseETS(UserList, ABC):
         """
         return self.data[0].axis
 
+    @property
+    def axis_id(self):
+        """
+        The transform type and axis as an integer
+
+        :return: The transform type and axis
+        :rtype: int
+
+        The value is one of ``AXIS_RX``, ``AXIS_RY``, ``AXIS_RZ``,
+        ``AXIS_TX``, ``AXIS_TY``, ``AXIS_TZ`` or ``AXIS_C`` defined in this
+        module, it is cheaper to test than the string :func:`axis`.  The 2D
+        rotation is ``AXIS_RZ``.
+
+        Example:
+
+        .. runblock:: pycon
+
+            >>> from roboticstoolbox import ETS
+            >>> e = ETS.tx(1)
+            >>> e.axis_id
+
+        """
+        return self.data[0].axis_id
+
+    @property
+    def data(self):
+        # the list of ETs, a property so that derived values can be
+        # discarded when it is replaced.  The value is kept in the instance
+        # dict, where UserList.__copy__ expects to find it
+        return self.__dict__['data']
+
+    @data.setter
+    def data(self, value):
+        self.__dict__['data'] = value
+        self._invalidate()
+
+    def _invalidate(self):
+        # discard values derived from the list of ETs, must be called
+        # whenever it is modified
+        self._versions = None  # versions of the ETs, see _refresh()
+        self._fk = {}  # generated evaluation functions, keyed by unit
+        self._soa = None  # packed form for the jitted kernels
+        self._joints = None  # indices of the joint ETs
+        self._structure = None  # joint structure string
+        self._eval_cache = OrderedDict()  # recent results of eval()
+        self._jacob0_buf = None  # scratch arrays for jacob0()
+        self._compiled = None  # ETs of the compiled ETS, see compile()
+        self._rotq = None  # coordinates used by rotations, see _eval()
+        self._strings = {}  # str() of the ETS, keyed by format
+        self._nq = None  # number of joint coordinates used, see _check_nq()
+        self._qidx = None  # joint coordinate of each joint, see _qindex()
+
+    def _refresh(self):
+        # the ET namespaces are shared with views such as e[i], and setting
+        # e[i].eta or e[i].jindex changes one in place, so discard derived
+        # values if any of our ET namespaces has changed since they were
+        # computed.  Their versions are only compared when some ET, of any
+        # ETS, has changed
+        if self._versions is not None:
+            if self._generation == _generation:
+                return
+            if all(et.version == v
+                    for et, v in zip(self.data, self._versions)):
+                self._generation = _generation
+                return
+            self._invalidate()
+        self._versions = [et.version for et in self.data]
+        self._generation = _generation
+
     @property
     def n(self):
         """
@@ -235,12 +833,7 @@ class BaseETS(UserList, ABC):
 
         :seealso: :func:`joints`
         """
-        n = 0
-        for et in self:
-            if et.isjoint:
-                n += 1
-
-        return n
+        return len(self.joints())
 
     @property
     def isjoint(self):
@@ -312,7 +905,12 @@ class BaseETS(UserList, ABC):
     def jindex(self, j):
         if not isinstance(j, int) or j < 0:
             raise TypeError(f'jindex is {j}, must be an int >= 0')
-        self.data[0].jindex = j
+        et = self.data[0]
+        if et.jindex == j:
+            return
+        et.jindex = j
+        _modified(et)
+        self._invalidate()
 
     @property
     def isrotation(self):
@@ -332,7 +930,7 @@ class BaseETS(UserList, ABC):
             >>> e = ETS.rx()
             >>> e.isrotation
         """
-        return self.axis[0] == 'R'
+        return self.data[0].axis_id <= AXIS_RZ
 
     @property
     def istranslation(self):
@@ -352,7 +950,7 @@ class BaseETS(UserList, ABC):
             >>> e = ETS.rx()
             >>> e.istranslation
         """
-        return self.axis[0] == 't'
+        return AXIS_TX <= self.data[0].axis_id <= AXIS_TZ
 
     @property
     def isconstant(self):
@@ -371,7 +969,7 @@ class BaseETS(UserList, ABC):
 
         :seealso: :func:`compile`
         """
-        return self.axis[0] == 'C'
+        return self.data[0].axis_id == AXIS_C
 
     @property
     def structure(self):
@@ -392,9 +990,13 @@ class BaseETS(UserList, ABC):
             >>> e = ETS.tz() * ETS.tx(1) * ETS.rz() * ETS.tx(1)
             >>> e.structure
 
+        .. note:: The result is cached.
         """
-        return ''.join(
-            ['R' if self.isrotation else 'P' for i in self.joints()])
+        if self._structure is None:
+            self._structure = ''.join(
+                ['R' if et.axis_id <= AXIS_RZ else 'P'
+                    for et in self.data if et.joint])
+        return self._structure
 
     @property
     def qlim(self):
@@ -415,8 +1017,15 @@ class BaseETS(UserList, ABC):
             >>> e = ETS.rz() * ETS.tx(1) * ETS.rz() * ETS.tx(1)
             >>> e.joints()
 
+        .. note:: The result is cached and is read only.
         """
-        return np.where([e.isjoint for e in self])[0]
+        if self._joints is None:
+            joints = np.fromiter(
+                (i for i, et in enumerate(self.data) if et.joint),
+                dtype=np.intp)
+            joints.setflags(write=False)
+            self._joints = joints
+        return self._joints
 
     def jointset(self):
         """
@@ -433,7 +1042,7 @@ class BaseETS(UserList, ABC):
             >>> e = ETS.rz(j=1) * ETS.tx(j=2) * ETS.rz(j=1) * ETS.tx(1)
             >>> e.jointset()
         """
-        return set([self[j].jindex for j in self.joints()])
+        return set([self.data[j].jindex for j in self.joints()])
 
     def T(self, q=None):
         """
@@ -496,37 +1105,441 @@ class BaseETS(UserList, ABC):
             >>> e = ETS.tx(j=1) * ETS.ty(j=0)
             >>> e.eval([3, 4])
         """
+        T = self.eval_array(q, unit)
+
+        if isinstance(self, ETS2):
+            T = SE2(T, check=False)
+        else:
+            T = SE3(T, check=False)
+
+        # optionally do symbolic simplification
+
+        if T.A.dtype == 'O':
+            T = T.simplify()
+
+        return T
+
+    def eval_array(self, q=None, unit='rad'):
+        """
+        Evaluate an ETS with joint coordinate substitution as an array
+
+        :param q: joint coordinates
+        :type q: array-like
+        :param unit: angular unit, "rad" [default] or "deg"
+        :type unit: str
+        :return: The SE(3) or SE(2) matrix value of the ET sequence
+        :rtype:  ndarray(4,4) or ndarray(3,3)
+
+        As for :func:`eval` but the result is a plain NumPy array, which
+        avoids the cost of creating an ``SE3`` or ``SE2`` instance, and
+        symbolic results are not simplified.
+
+        Example:
+
+        .. runblock:: pycon
+
+            >>> from roboticstoolbox import ETS
+            >>> e = ETS.rz() * ETS.tx(1) * ETS.rz() * ETS.tx(1)
+            >>> e.eval_array([0, 0])
+
+        :seealso: :func:`eval`
+        """
+        T = self._eval(q, unit)
+        if T.dtype != object:
+            # the caller gets a copy, the cached value must not change
+            T = T.copy()
+        return T
+
+    def _qindex(self):
+        # the joint coordinate used by each joint, in order, cached.  Joints
+        # without an explicit index take their coordinates in order.  Every
+        # evaluator numbers the coordinates this way, and joints keep their
+        # order when the ETS is compiled or packed
+        self._refresh()
+        if self._qidx is None:
+            qidx = []
+            j = 0
+            for et in self.data:
+                if et.joint:
+                    if et.jindex is None:
+                        qidx.append(j)
+                        j += 1
+                    else:
+                        qidx.append(et.jindex)
+            self._qidx = tuple(qidx)
+        return self._qidx
+
+    def _check_nq(self, nq):
+        # check that nq joint coordinates are enough for the ETS, which
+        # uses every coordinate up to the largest joint index, that is n
+        # unless joints share a coordinate.  The jitted kernels index q
+        # without bounds checks, so this must be called before them.  It is
+        # the first thing the evaluators do, so refresh the cached values,
+        # including eval() results, here
+        self._refresh()
+        if self._nq is None:
+            self._nq = max(self._qindex(), default=-1) + 1
+        if nq < self._nq:
+            raise ValueError(
+                f'{self._nq} joint coordinates required, {nq} given')
+
+    def _eval(self, q, unit):
+        # evaluate the ETS as an array.  Numeric results are cached and may
+        # be returned as is, the caller must not modify them
+        if q is not None:
+            q = getvector(q)
+        self._check_nq(0 if q is None else len(q))
+        numeric = q is None or q.dtype != object
+
+        if unit == 'deg' and q is not None and numeric:
+            # convert the angles to radians up front, then all the
+            # evaluators work in radians
+            rotq = self._rotation_coords()
+            if rotq is not None:
+                q = q.astype(np.float64)
+                q[rotq] *= np.pi / 180
+                unit = 'rad'
+
+        T = None
+        if numeric:
+            # solvers often evaluate the same configuration repeatedly, so
+            # keep the last few results
+            if q is None:
+                key = (unit,)
+            else:
+                key = (unit, q.dtype.str, q.tobytes())
+            T = self._eval_cache.get(key)
+            if T is not None:
+                self._eval_cache.move_to_end(key)
+                return T
+
+        fk = None
+        soa = None
+        if numeric:
+            # numeric case, use the jitted kernel if Numba is available
+            # otherwise for an ETS the generated straight-line function
+            if _numba:
+                soa = self._pack()
+            elif isinstance(self, ETS):
+                fk = self._compile_eval(unit)
+
+        if soa is not None:
+            if q is None:
+                q = np.zeros(0)
+            scale = np.pi / 180 if unit == 'deg' else 1.0
+            kernel = _fk_kernel if self._ndims == 3 else _fk2_kernel
+            T = kernel(*soa, q.astype(np.float64, copy=False), scale)
+        elif fk is not None:
+            # index a list, not an array, to get Python floats
+            T = fk(None if q is None else q.tolist())
+        else:
+            T = self._eval_loop(q, unit)
+
+        if numeric and T.dtype != object:
+            self._eval_cache[key] = T
+            if len(self._eval_cache) > self._eval_cache_size:
+                self._eval_cache.popitem(last=False)
+
+        return T
+
+    def _rotation_coords(self):
+        # indices of the joint coordinates that are used by rotational
+        # joints, cached.  None if a coordinate is used by both a rotational
+        # and a prismatic joint, it cannot be converted once to radians
+        self._refresh()
+        if self._rotq is None:
+            rotation = set()
+            translation = set()
+            qindex = iter(self._qindex())
+            for et in self.data:
+                if et.joint:
+                    k = next(qindex)
+                    if et.axis_id <= AXIS_RZ:
+                        rotation.add(k)
+                    else:
+                        translation.add(k)
+            if rotation & translation:
+                self._rotq = ()
+            else:
+                self._rotq = np.array(sorted(rotation), dtype=np.intp)
+        if isinstance(self._rotq, tuple):
+            return None
+        return self._rotq
+
+    def _eval_loop(self, q, unit):
+        # evaluate the ETS one element at a time, this handles all cases
+        # including symbolic values.  Work directly with the namespaces of
+        # the compiled ETS, so runs of constants are already folded, et.T is
+        # the stored constant matrix.  Index a list, not an array, so joint
+        # values are Python floats
         if q is not None:
-            q = getvector(q, out='list')
+            q = q.tolist()
         first = True
-        for et in self:
-            if et.isjoint:
-                if et.jindex is None:
-                    qj = q.pop(0)
-                else:
-                    qj = q[et.jindex]
-                if et.isrotation and unit == 'deg':
+        qindex = iter(self._qindex())
+        for et in self._compile():
+            if et.joint:
+                qj = q[next(qindex)]
+                isrotation = et.axis_id <= AXIS_RZ
+                if isrotation and unit == 'deg':
                     qj *= np.pi / 180.0
-
-                Tk = et.T(qj)
+                if et.flip:
+                    qj = -qj
+
+                if issymbol(qj):
+                    Tk = et.axis_func(qj)
+                elif qj == et.last_q:
+                    # same value as last time, typically an iterative
+                    # solver, reuse the matrix.  It must not be modified
+                    Tk = et.last_T
+                else:
+                    Tk = et.axis_func(qj)
+                    et.last_q = qj
+                    et.last_T = Tk
             else:
                 # for constants
-                Tk = et.T()
+                Tk = et.T
             if first:
                 T = Tk
                 first = False
             else:
                 T = T @ Tk
 
-        if isinstance(self, ETS2):
-            T = SE2(T, check=False)
-        else:
-            T = SE3(T, check=False)
+        if first:
+            # no joints and the constants fold to the identity
+            T = np.eye(self._ndims + 1)
 
-        # optionally do symbolic simplification
+        return T
 
-        if T.A.dtype == 'O':
-            T = T.simplify()
+    def eval_symbolic(self, q=None, unit='rad'):
+        """
+        Symbolic evaluation of an ETS with common subexpressions
+
+        :param q: joint coordinates, defaults to symbols ``q0``, ``q1``, ...
+        :type q: array-like
+        :param unit: angular unit, "rad" [default] or "deg"
+        :type unit: str
+        :return: subexpressions and the reduced SE(3) or SE(2) matrix
+        :rtype: list of (Symbol, Expr), sympy Matrix
+
+        The ETS is evaluated symbolically and SymPy's ``cse`` is applied to
+        the result, so that terms such as ``sin(q0)`` which appear in many
+        elements of the matrix are computed once.  The subexpressions are
+        given as ``(symbol, expression)`` pairs in the order they must be
+        evaluated.
+
+        Example:
+
+        .. runblock:: pycon
+
+            >>> from roboticstoolbox import ETS
+            >>> e = ETS.rz() * ETS.tx(1) * ETS.rz() * ETS.tx(1)
+            >>> subs, T = e.eval_symbolic()
+            >>> subs
+            >>> T
+
+        :SymPy: required
+        :seealso: :func:`eval`, :func:`lambdify`
+        """
+        import sympy
+
+        if q is None:
+            q = self._qsymbols()
+        T = sympy.Matrix(self.eval_array(q, unit))
+        subs, reduced = sympy.cse(T, optimizations='basic')
+        return subs, reduced[0]
+
+    def lambdify(self, unit='rad'):
+        """
+        Generate a numeric function from the symbolic ETS
+
+        :param unit: angular unit, "rad" [default] or "deg"
+        :type unit: str
+        :return: function that maps joint coordinates to a transform
+        :rtype: callable
+
+        The ETS is evaluated symbolically, with joint coordinates
+        ``q0``, ``q1``, ..., and converted to a NumPy function using SymPy's
+        ``lambdify`` with common subexpression elimination.  The function
+        has the signature ``f(q) -> ndarray(4,4)`` or ``ndarray(3,3)``.
+
+        Example:
+
+        .. runblock:: pycon
+
+            >>> from roboticstoolbox import ETS
+            >>> e = ETS.rz() * ETS.tx(1) * ETS.rz() * ETS.tx(1)
+            >>> f = e.lambdify()
+            >>> f([0.1, 0.2])
+
+        :SymPy: required
+        :seealso: :func:`eval_symbolic`
+        """
+        import sympy
+
+        q = self._qsymbols()
+        T = sympy.Matrix(self.eval_array(q, unit))
+        return sympy.lambdify([q], T, modules='numpy', cse=True)
+
+    def _qsymbols(self):
+        # symbolic joint coordinates q0, q1, ... covering all the joint
+        # indices used by the ETS
+        m = max(self._qindex(), default=-1) + 1
+        return list(symbol(f'q0:{m}')) if m > 0 else []
+
+    def _pack(self):
+        """
+        Pack the ETS into parallel arrays
+
+        :return: axis codes, joint indices, joint signs and constants
+        :rtype: tuple of ndarray, or None
+
+        The ETS is converted to a structure of arrays for the jitted kernels.
+        Each row is either a joint, with integer axis code 0-5 for Rx, Ry,
+        Rz, tx, ty, tz, or a constant with code 6.  Consecutive constant ETs
+        are folded and stored in order in the constants array of shape
+        (m,4,4), or (m,3,3) for an ETS2.
+
+        The result is cached on the instance.  Returns None if the ETS is
+        empty or has symbolic constants.
+        """
+        self._refresh()
+        if self._soa is not None:
+            return self._soa or None
+
+        soa = ()
+        if len(self.data) > 0 and all(
+                et.joint or et.T.dtype != object for et in self.data):
+            codes = []
+            jindex = []
+            sign = []
+            consts = []
+
+            const = None
+            qindex = iter(self._qindex())
+            for et in self.data:
+                if et.joint:
+                    if const is not None and not iseye(const):
+                        codes.append(AXIS_C)
+                        jindex.append(-1)
+                        sign.append(0)
+                        consts.append(const)
+                    const = None
+                    codes.append(et.axis_id)
+                    jindex.append(next(qindex))
+                    sign.append(-1 if et.flip else 1)
+                elif const is None:
+                    const = et.T
+                else:
+                    const = const @ et.T
+            if const is not None and (not iseye(const) or len(codes) == 0):
+                codes.append(AXIS_C)
+                jindex.append(-1)
+                sign.append(0)
+                consts.append(const)
+
+            soa = (
+                np.array(codes, dtype=np.int8),
+                np.array(jindex, dtype=np.int64),
+                np.array(sign, dtype=np.float64),
+                np.array(consts, dtype=np.float64).reshape(
+                    (-1, self._ndims + 1, self._ndims + 1))
+            )
+
+        self._soa = soa
+        return soa or None
+
+    def eval_batch(self, Q, unit='rad', dtype=np.float64):
+        """
+        Evaluate an ETS for many joint configurations
+
+        :param Q: joint coordinates, one configuration per row
+        :type Q: array_like(B,n)
+        :param unit: angular unit, "rad" [default] or "deg"
+        :type unit: str
+        :param dtype: floating point type of the result, default float64
+        :type dtype: NumPy dtype
+        :return: the transforms, one per configuration
+        :rtype: ndarray(B,4,4) or ndarray(B,3,3)
+        :raises ValueError: if ``dtype`` is not float32 or float64
+
+        ``ets.eval_batch(Q)`` is equivalent to stacking ``ets.eval(q).A``
+        for each row ``q`` of ``Q``, but each ET is applied to all
+        configurations at once so the Python overhead does not grow with
+        the number of configurations.  If Numba is available the ETS is
+        instead evaluated by a compiled kernel that runs the configurations
+        in parallel threads.
+
+        With ``dtype=np.float32`` the result, and the arrays the evaluation
+        works on, take half the memory, at a precision that is usually
+        sufficient for visualization or control.
+
+        Example:
+
+        .. runblock:: pycon
+
+            >>> from roboticstoolbox import ETS
+            >>> import numpy as np
+            >>> e = ETS.rz() * ETS.tx(1) * ETS.rz() * ETS.tx(1)
+            >>> T = e.eval_batch(np.random.rand(100, 2))
+            >>> T.shape
+            >>> T = e.eval_batch([[0, 0], [90, -90]], 'deg')
+            >>> T = e.eval_batch(np.random.rand(100, 2), dtype=np.float32)
+
+        :seealso: :func:`eval`
+        """
+        dtype = np.dtype(dtype)
+        if dtype not in (np.float32, np.float64):
+            raise ValueError('dtype must be float32 or float64')
+        Q = np.array(Q, dtype=dtype, ndmin=2)
+        self._check_nq(Q.shape[1])
+        B = Q.shape[0]
+        d = self._ndims  # translation is column d
+
+        soa = self._pack()
+        if soa is None:
+            # symbolic constants, evaluate one at a time
+            return np.array(
+                [self.eval_array(q, unit) for q in Q]).reshape(
+                    (B, d + 1, d + 1))
+
+        if unit == 'deg':
+            scale = np.pi / 180
+        else:
+            scale = 1.0
+
+        codes, jindex, sign, consts = soa
+        consts = consts.astype(dtype, copy=False)
+        if _numba:
+            # jitted, the configurations are evaluated in parallel
+            # the arithmetic, including the trig functions, is in dtype
+            kernel = _fk_batch_kernel if d == 3 else _fk2_batch_kernel
+            T = np.empty((B, d + 1, d + 1), dtype=dtype)
+            kernel(
+                codes, jindex, sign.astype(dtype, copy=False), consts, Q,
+                dtype.type(scale), T)
+            return T
+
+        T = np.tile(np.eye(d + 1, dtype=dtype), (B, 1, 1))
+        k = 0
+        for code, j, sgn in zip(codes, jindex, sign):
+            if code == AXIS_C:
+                T = T @ consts[k]
+                k += 1
+                continue
+
+            x = (sgn * Q[:, j])[:, np.newaxis]
+            if code <= AXIS_RZ:
+                # rotation, mix two columns
+                a, b = _ROT_COLS[code]
+                x = x * scale
+                c = np.cos(x)
+                s = np.sin(x)
+                Ta = T[:, :d, a].copy()
+                T[:, :d, a] = c * Ta + s * T[:, :d, b]
+                T[:, :d, b] = c * T[:, :d, b] - s * Ta
+            else:
+                # translation, update the last column
+                T[:, :d, d] += x * T[:, :d, code - AXIS_TX]
 
         return T
 
@@ -554,11 +1567,16 @@ class BaseETS(UserList, ABC):
         Compile an ETS
 
         :return: optimised ETS
-        :rtype: ETS
+        :rtype: ETS or ETS2
 
         Perform constant folding for faster evaluation.  Consecutive constant
         ETs are compounded, leading to a constant ET which is denoted by
-        ``Ci`` when displayed.
+        ``Ci`` when displayed.  If they are all about the same axis they are
+        instead merged into a single elementary ET, for example
+        ``ETS.rz(a) * ETS.rz(b)`` becomes ``ETS.rz(a + b)``.
+
+        The folded sequence is computed once and cached, it is also used
+        internally to evaluate the ETS with symbolic values.
 
         Example:
 
@@ -572,30 +1590,66 @@ class BaseETS(UserList, ABC):
 
         :seealso: :func:`isconstant`
         """
-        const = None
-        ets = ETS()
-        for et in self:
-
-            if et.isjoint:
-                # a joint
-                if const is not None:
-                    # flush the constant
-                    if not iseye(const):
-                        ets *= ETS._CONST(const)
-                    const = None
-                ets *= et  # emit the joint ET
-            else:
-                # not a joint
-                if const is None:
-                    const = et.T()
+        ets = self.__class__()
+        ets.data = list(self._compile())
+        return ets
+
+    def _compile(self):
+        # the list of ETs of the compiled ETS, cached
+        self._refresh()
+        if self._compiled is None:
+            run = []  # consecutive constant ETs
+            compiled = []
+            for et in self.data:
+
+                if et.joint:
+                    # a joint
+                    if len(run) > 0:
+                        # flush the constants
+                        compiled.extend(self._fold(run).data)
+                        run = []
+                    compiled.append(et)  # emit the joint ET
                 else:
-                    const = const @ et.T()
+                    # not a joint
+                    run.append(et)
 
-        if const is not None:
-            # flush the constant, tool transform
-            if not iseye(const):
-                ets *= ETS._CONST(const)
-        return ets
+            if len(run) > 0:
+                # flush the constants, tool transform
+                compiled.extend(self._fold(run).data)
+            self._compiled = compiled
+        return self._compiled
+
+    @classmethod
+    def _fold(cls, run):
+        # fold a run of constant ETs into a single ET.  If they are all
+        # about the same axis the result is an elementary ET whose value is
+        # the sum of theirs, otherwise a constant ET ``Ci``.  An empty ETS
+        # is returned if the result is the identity
+
+        # identity elements, such as _CONST(SE3()), contribute nothing and
+        # would stop a run about one axis from folding to an elementary ET
+        run = [et for et in run if et.T.dtype == object or not iseye(et.T)]
+        if len(run) == 0:
+            return cls()
+
+        axis = run[0].axis
+        if axis != 'C' and all(et.axis == axis for et in run):
+            eta = run[0].eta
+            for et in run[1:]:
+                eta = eta + et.eta
+            if issymbol(eta):
+                eta = simplify(eta)
+            folded = getattr(cls, axis.lower())(eta)
+            T = folded.data[0].T
+        else:
+            T = run[0].T
+            for et in run[1:]:
+                T = T @ et.T
+            folded = cls._CONST(T)
+
+        if T.dtype != object and iseye(T):
+            return cls()
+        return folded
 
     def __str__(self, q=None):
         """
@@ -651,6 +1705,14 @@ class BaseETS(UserList, ABC):
 
         :SymPy: supported
         """
+        # the string is cached for each format, an ETS is often printed
+        # repeatedly
+        self._refresh()
+        cached = self._strings.get(q)
+        if cached is not None:
+            return cached
+
+        fmt = q
         es = []
         j = 0
         c = 0
@@ -661,11 +1723,10 @@ class BaseETS(UserList, ABC):
             else:
                 q = "q"
 
-        # For et in the object, display it, data comes from properties
-        # which come from the named tuple
-        for et in self:
+        # For et in the object, display it, data comes from the namespace
+        for et in self.data:
 
-            if et.isjoint:
+            if et.joint:
                 if q is not None:
                     if et.jindex is None:
                         _j = j
@@ -674,28 +1735,30 @@ class BaseETS(UserList, ABC):
                     qvar = q.format(_j, _j+1)  # lgtm [py/str-format/surplus-argument]  # noqa
                 else:
                     qvar = ""
-                if et.isflip:
+                if et.flip:
                     s = f"{et.axis}(-{qvar})"
                 else:
                     s = f"{et.axis}({qvar})"
                 j += 1
 
-            elif et.isrotation:
+            elif et.axis_id <= AXIS_RZ:
                 if issymbol(et.eta):
                     s = f"{et.axis}({et.eta:.4g})"
                 else:
                     s = f"{et.axis}({et.eta * 180 / np.pi:.4g}°)"
 
-            elif et.istranslation:
+            elif et.axis_id <= AXIS_TZ:
                 s = f"{et.axis}({et.eta:.4g})"
 
-            elif et.isconstant:
+            elif et.axis_id == AXIS_C:
                 s = f"C{c}"
                 c += 1
 
             es.append(s)
 
-        return " \u2295 ".join(es)
+        s = " \u2295 ".join(es)
+        self._strings[fmt] = s
+        return s
 
     # redefine * operator to concatenate the internal lists
     def __add__(self, rest):
@@ -730,9 +1793,42 @@ class BaseETS(UserList, ABC):
         return prod
 
     def __imul__(self, rest):
-        prod = self.__class__()
-        prod.data = self.data + rest.data
-        return prod
+        """
+        Overloaded ``*=`` operator
+
+        :return: this instance, extended by ``rest``
+        :rtype: ETS instance
+
+        ``e *= e2`` appends the ETs of ``e2`` to ``e`` in place, see
+        :func:`extend`.  Building a chain this way is linear in its length,
+        whereas ``e = e * e2`` copies the list each time.
+
+        .. note:: Other references to ``e`` see the change.
+        """
+        self.extend(rest)
+        return self
+
+    def extend(self, rest):
+        """
+        Extend value
+
+        :param rest: the elementary transforms to append
+        :type rest: ETS
+
+        Appends the ETs of ``rest`` to the ET sequence.  The original
+        instance is modified.
+
+        Example:
+
+        .. runblock:: pycon
+
+            >>> from roboticstoolbox import ETS
+            >>> e = ETS.rz() * ETS.tx(1)
+            >>> e.extend(ETS.rz() * ETS.tx(1))
+            >>> e
+        """
+        self.data.extend(rest.data)
+        self._invalidate()
 
     # redefine so that indexing returns an ET type
     def __getitem__(self, i):
@@ -789,6 +1885,7 @@ class BaseETS(UserList, ABC):
         """
         item = self.__class__()
         item.data = [super().pop(i)]
+        self._invalidate()
         return item
 
     def insert(self, i=-1, et=None):
@@ -814,13 +1911,99 @@ class BaseETS(UserList, ABC):
             >>> e
         """
         self.data.insert(i, et.data[0])
+        self._invalidate()
+
+    # the other list mutators inherited from UserList change self.data in
+    # place, redefine them so that derived values are discarded
+
+    def __setitem__(self, i, et):
+        """
+        Set value
+
+        :param i: index or slice
+        :type i: int or slice
+        :param et: the elementary transform(s) to put there
+        :type et: ETS
+
+        Example:
+
+        .. runblock:: pycon
+
+            >>> from roboticstoolbox import ETS
+            >>> e = ETS.rz() * ETS.tx(1) * ETS.rz() * ETS.tx(1)
+            >>> e[1] = ETS.ty(2)
+            >>> e
+        """
+        if isinstance(i, slice):
+            self.data[i] = et.data
+        else:
+            self.data[i] = et.data[0]
+        self._invalidate()
+
+    def __delitem__(self, i):
+        del self.data[i]
+        self._invalidate()
+
+    def __iadd__(self, rest):
+        self.extend(rest)
+        return self
+
+    def append(self, et):
+        """
+        Append value
+
+        :param et: the elementary transform to append
+        :type et: ETS
+
+        Appends an ET to the ET sequence.  The original instance is modified.
+        """
+        self.data.append(et.data[0])
+        self._invalidate()
+
+    def remove(self, et):
+        """
+        Remove value
+
+        :param et: the elementary transform to remove
+        :type et: ETS
+        :raises ValueError: if the ET is not in the sequence
+
+        Removes the first occurrence of the ET, as obtained by indexing this
+        ETS, from the ET sequence.  The original instance is modified.
+        """
+        for i, e in enumerate(self.data):
+            if e is et.data[0]:
+                del self[i]
+                return
+        raise ValueError('ET is not in the ETS')
+
+    def clear(self):
+        """
+        Remove all values
+
+        The original instance is modified.
+        """
+        self.data.clear()
+        self._invalidate()
+
+    def reverse(self):
+        """
+        Reverse the sequence
+
+        The order of the ETs is reversed in place, the ETs themselves are
+        not inverted, see :func:`inv`.
+        """
+        self.data.reverse()
+        self._invalidate()
 
     def __repr__(self):
         return str(self)
 
     @classmethod
     def _CONST(cls, T):
-        return cls(None, axis='C', eta=T)
+        # constant ET, the matrix is stored as the T attribute of the
+        # element so evaluation never calls an axis function for it
+        return cls(axis='C', eta=T)
 
     @classmethod
     def SE3(cls, t, rpy=None, tol=100):
@@ -919,7 +2102,7 @@ class BaseETS(UserList, ABC):
             nsi = copy.copy(ns)
             if nsi.joint:
                 nsi.flip ^= True   # toggle flip status
-            elif nsi.axis[0] == 'C':
+            elif nsi.axis_id == AXIS_C:
                 nsi.T = self._inverse(nsi.T)
             elif nsi.eta is not None:
                 nsi.T = self._inverse(nsi.T)
@@ -1007,23 +2190,188 @@ class ETS(BaseETS):
     def _inverse(self, T):
         return trinv(T)
 
+    def _compile_eval(self, unit='rad'):
+        """
+        Generate a forward kinematic function for the ETS
+
+        :param unit: angular unit, "rad" [default] or "deg"
+        :type unit: str
+        :return: function that maps joint coordinates to a transform
+        :rtype: callable or None
+
+        The ETS is unrolled into a straight-line Python function
+        ``fk(q) -> ndarray(4,4)``.  Consecutive constant ETs are folded into
+        a single matrix, and each joint is a direct call to its in-place
+        update function so there is no per-element dispatch when it is
+        called.  The cosine and sine of each joint coordinate are computed
+        once, at the start, and shared by all the rotations that use it.
+
+        The function is cached on the instance, and the generated code is
+        shared by all ETS with the same structure, see :func:`_signature`,
+        so that robots built from the same model are compiled only once.
+        Returns None, and the caller must fall back to the general
+        evaluator, if the ETS is empty or has symbolic constants.
+        """
+        self._refresh()
+        try:
+            return self._fk[unit]
+        except KeyError:
+            pass
+
+        fk = None
+        if len(self.data) > 0 and all(
+                et.joint or et.T.dtype != object for et in self.data):
+            fk = _compile_fk(unit, self._signature())
+
+        self._fk[unit] = fk
+        return fk
+
+    def eval_jax(self, q, unit='rad'):
+        """
+        Evaluate an ETS using JAX
+
+        :param q: joint coordinates
+        :type q: array-like
+        :param unit: angular unit, "rad" [default] or "deg"
+        :type unit: str
+        :return: The SE(3) matrix value of the ET sequence
+        :rtype: jax.Array(4,4)
+
+        As for :func:`eval_array` but the forward kinematics is a jitted JAX
+        function of ``q``, a scan over the packed ETS, so it can be
+        differentiated with ``jax.grad`` or ``jax.jacfwd``, vectorized with
+        ``jax.vmap`` and run on a GPU.
+
+        .. note:: JAX computes in single precision unless the
+            ``jax_enable_x64`` option is set.
+
+        Example:
+
+        .. runblock:: pycon
+
+            >>> from roboticstoolbox import ETS
+            >>> import jax
+            >>> import jax.numpy as jnp
+            >>> e = ETS.rz() * ETS.tx(1) * ETS.rz() * ETS.tx(1)
+            >>> e.eval_jax([0.1, 0.2])
+            >>> jax.vmap(e.eval_jax)(jnp.zeros((10, 2))).shape
+
+        :JAX: required
+        :seealso: :func:`eval_array`, :func:`eval_batch`
+        """
+        import jax.numpy as jnp
+
+        # JAX clamps out of range indices rather than raising, so check the
+        # length of q, which may be a tracer, up front
+        shape = jnp.shape(q)
+        self._check_nq(shape[-1] if shape else 1)
+
+        soa = self._pack()
+        if soa is None:
+            raise ValueError('ETS must be non-empty and numeric')
+        codes, jindex, sign, consts = soa
+
+        # expand the constants to one per step, identity for a joint, and
+        # apply the unit conversion to the signs of the rotations
+        C = np.tile(np.eye(4), (len(codes), 1, 1))
+        C[codes == AXIS_C] = consts
+        if unit == 'deg':
+            sign = np.where(codes <= AXIS_RZ, sign * np.pi / 180, sign)
+        jindex = np.maximum(jindex, 0)
+
+        return _jax_kernel()(
+            codes.astype(np.int32), jindex, jnp.asarray(sign),
+            jnp.asarray(C), jnp.asarray(q, dtype=jnp.result_type(float)))
+
+    def generate_python(self, name='fk', unit='rad'):
+        """
+        Generate Python source for the forward kinematics of the ETS
+
+        :param name: name of the generated function, defaults to "fk"
+        :type name: str
+        :param unit: angular unit of its argument, "rad" [default] or "deg"
+        :type unit: str
+        :return: Python source code
+        :rtype: str
+        :raises ValueError: if the ETS has symbolic constants
+
+        The source is a standalone module which defines the function
+        ``name(q) -> ndarray(4,4)``, where ``q`` is the vector of joint
+        coordinates.  The ETS is unrolled into straight-line code, with
+        the constants folded, and it is the same code that :func:`eval`
+        uses when Numba is not available.  It can be written to a file, or
+        compiled with ``exec``.
+
+        Example:
+
+        .. runblock:: pycon
+
+            >>> from roboticstoolbox import ETS
+            >>> e = ETS.rz() * ETS.tx(1) * ETS.rz() * ETS.tx(1)
+            >>> print(e.generate_python())
+
+        :seealso: :func:`eval`, :func:`compile`
+        """
+        if not all(et.joint or et.T.dtype != object for et in self.data):
+            raise ValueError('cannot generate code with symbolic constants')
+
+        src, consts, updaters = _fk_source(unit, self._signature(), name)
+
+        parts = ["from math import cos, sin\nfrom numpy import array, eye\n"]
+        for f in updaters:
+            parts.append(inspect.getsource(f))
+        if len(consts) > 0:
+            parts.append("".join(
+                [f"{cname} = array({C.tolist()!r})\n"
+                    for cname, C in consts.items()]))
+        parts.append(src)
+        return "\n\n".join(parts)
+
+    def _signature(self):
+        """
+        Structural signature of the ETS
+
+        :return: joints and folded constants in order
+        :rtype: tuple
+
+        Each joint is represented by a tuple ``(axis_id, k, flip)`` where
+        ``k`` is the index into the joint coordinate vector, and each run of
+        consecutive constant ETs by the bytes of their product, omitted if
+        it is the identity.  Two ETS with equal signatures have the same
+        forward kinematics.  The ETS must not have symbolic constants.
+        """
+        sig = []
+        const = None
+        qindex = iter(self._qindex())
+
+        def flush(C):
+            if C is not None and not iseye(C):
+                sig.append(np.asarray(C, dtype=np.float64).tobytes())
+
+        for et in self.data:
+            if et.joint:
+                flush(const)
+                const = None
+                sig.append((et.axis_id, next(qindex), et.flip))
+            elif const is None:
+                const = et.T
+            else:
+                const = const @ et.T
+        flush(const)
+        return tuple(sig)
+
     @property
     def s(self):
-        if self.axis[1] == 'x':
-            if self.axis[0] == 'R':
-                return np.r_[0, 0, 0, 1, 0, 0]
-            else:
-                return np.r_[1, 0, 0, 0, 0, 0]
-        elif self.axis[1] == 'y':
-            if self.axis[0] == 'R':
-                return np.r_[0, 0, 0, 0, 1, 0]
-            else:
-                return np.r_[0, 1, 0, 0, 0, 0]
+        # unit twist, a rotation about axis k is element 3 + k, a
+        # translation along it is element k
+        axis_id = self.data[0].axis_id
+        if axis_id <= AXIS_RZ:
+            k = axis_id + 3
         else:
-            if self.axis[0] == 'R':
-                return np.r_[0, 0, 0, 0, 0, 1]
-            else:
-                return np.r_[0, 0, 1, 0, 0, 0]
+            k = axis_id - AXIS_TX
+        s = np.zeros(6)
+        s[k] = 1
+        return s
 
     @classmethod
     def rx(cls, eta=None, unit='rad', **kwargs):
@@ -1050,7 +2398,14 @@ class ETS(BaseETS):
         :seealso: :func:`ETS`, :func:`isrotation`
         :SymPy: supported
         """
-        return cls(axis='Rx', eta=eta, axis_func=trotx, unit=unit, **kwargs)
+        def axis_func(eta):
+            if issymbol(eta):
+                return trotx(eta)
+            else:
+                return _fast_rx(eta, _I4.copy())
+
+        return cls(
+            axis='Rx', eta=eta, axis_func=axis_func, unit=unit, **kwargs)
 
     @classmethod
     def ry(cls, eta=None, unit='rad', **kwargs):
@@ -1077,7 +2432,14 @@ class ETS(BaseETS):
         :seealso: :func:`ETS`, :func:`isrotation`
         :SymPy: supported
         """
-        return cls(axis='Ry', eta=eta, axis_func=troty, unit=unit, **kwargs)
+        def axis_func(eta):
+            if issymbol(eta):
+                return troty(eta)
+            else:
+                return _fast_ry(eta, _I4.copy())
+
+        return cls(
+            axis='Ry', eta=eta, axis_func=axis_func, unit=unit, **kwargs)
 
     @classmethod
     def rz(cls, eta=None, unit='rad', **kwargs):
@@ -1104,7 +2466,14 @@ class ETS(BaseETS):
         :seealso: :func:`ETS`, :func:`isrotation`
         :SymPy: supported
         """
-        return cls(axis='Rz', eta=eta, axis_func=trotz, unit=unit, **kwargs)
+        def axis_func(eta):
+            if issymbol(eta):
+                return trotz(eta)
+            else:
+                return _fast_rz(eta, _I4.copy())
+
+        return cls(
+            axis='Rz', eta=eta, axis_func=axis_func, unit=unit, **kwargs)
 
     @classmethod
     def tx(cls, eta=None, **kwargs):
@@ -1130,14 +2499,10 @@ class ETS(BaseETS):
         :SymPy: supported
         """
 
-        # this method is 3x faster than using lambda x: transl(x, 0, 0)
+        # copying the identity is much faster than building from a list,
+        # or using lambda x: transl(x, 0, 0)
         def axis_func(eta):
-            return np.array([
-                [1, 0, 0, eta],
-                [0, 1, 0, 0],
-                [0, 0, 1, 0],
-                [0, 0, 0, 1]
-            ])
+            return _transl(_I4, 0, eta)
 
         return cls(axis='tx', axis_func=axis_func, eta=eta, **kwargs)
 
@@ -1165,12 +2530,7 @@ class ETS(BaseETS):
         :SymPy: supported
         """
         def axis_func(eta):
-            return np.array([
-                [1, 0, 0, 0],
-                [0, 1, 0, eta],
-                [0, 0, 1, 0],
-                [0, 0, 0, 1]
-            ])
+            return _transl(_I4, 1, eta)
 
         return cls(axis='ty', eta=eta, axis_func=axis_func, **kwargs)
 
@@ -1200,12 +2560,7 @@ class ETS(BaseETS):
         :SymPy: supported
         """
         def axis_func(eta):
-            return np.array([
-                [1, 0, 0, 0],
-                [0, 1, 0, 0],
-                [0, 0, 1, eta],
-                [0, 0, 0, 1]
-            ])
+            return _transl(_I4, 2, eta)
 
         return cls(axis='tz', axis_func=axis_func, eta=eta, **kwargs)
 
@@ -1216,7 +2571,7 @@ class ETS(BaseETS):
         :param q: joint coordinates
         :type q: array_like
         :param T: ETS value as an SE(3) matrix if known
-        :type T: ndarray(4,4)
+        :type T: SE3 instance or ndarray(4,4)
         :return: Jacobian matrix
         :rtype: ndarray(6,n)
 
@@ -1264,64 +2619,167 @@ class ETS(BaseETS):
         n = self.n  # number of joints
         q = getvector(q, n)
 
-        if T is None:
-            T = self.eval(q)
+        # the Jacobian has n columns, each joint index must be one of them
+        self._check_nq(n)
 
-        # we will work with NumPy arrays for maximum speed
-        T = T.A
-        U = np.eye(4)  # SE(3) matrix
-        j = 0
-        J = np.zeros((6, n))
+        soa = None
+        if q.dtype != object:
+            soa = self._pack()
 
-        for et in self:
+        if T is not None and not isinstance(T, np.ndarray):
+            T = T.A
 
-            if et.isjoint:
-                # joint variable
-                # U = U @ link.A(q[j], fast=True)
-                U = U @ et.T(q[j])
+        if _numba and soa is not None:
+            if T is None:
+                T = self._eval(q, 'rad')
+            codes, jindex, sign, consts = soa
+            return _jacob0_kernel(
+                codes, jindex, sign, consts, q.astype(np.float64, copy=False),
+                T.astype(np.float64, copy=False))
+
+        return self._jacob0(q, soa, T)[1]
+
+    def jacob0_fused(self, q=None):
+        r"""
+        Pose and Jacobian in base frame
+
+        :param q: joint coordinates
+        :type q: array_like
+        :return: ETS value as an SE(3) matrix and Jacobian matrix
+        :rtype: ndarray(4,4), ndarray(6,n)
 
-                # TODO???
-                # if link == to_link:
-                #     U = U @ offset.A
+        ``T, J = jacob0_fused(q)`` is the same as ``ets.eval(q).A`` and
+        ``ets.jacob0(q)`` but walks the ETS once, the joint frames found
+        while composing the pose give the Jacobian columns.
 
-                Tu = trinv(U) @ T
-                n = U[:3, 0]
-                o = U[:3, 1]
-                a = U[:3, 2]
-                x = Tu[0, 3]
-                y = Tu[1, 3]
-                z = Tu[2, 3]
+        :seealso: :func:`jacob0`, :func:`eval_array`
+        """
+        q = getvector(q, self.n)
+        self._check_nq(self.n)
 
-                if et.axis == 'Rz':
-                    J[:3, j] = (o * x) - (n * y)
-                    J[3:, j] = a
+        soa = None
+        if q.dtype != object:
+            soa = self._pack()
 
-                elif et.axis == 'Ry':
-                    J[:3, j] = (n * z) - (a * x)
-                    J[3:, j] = o
+        if _numba and soa is not None:
+            codes, jindex, sign, consts = soa
+            return _jacob0_fused_kernel(
+                codes, jindex, sign, consts, q.astype(np.float64, copy=False))
 
-                elif et.axis == 'Rx':
-                    J[:3, j] = (a * y) - (o * z)
-                    J[3:, j] = n
+        U, J = self._jacob0(q, soa, None)
+        return U.copy(), J
 
-                elif et.axis == 'tx':
-                    J[:3, j] = n
-                    J[3:, j] = np.array([0, 0, 0])
+    def _jacob0(self, q, soa, T):
+        # Jacobian in base frame by walking the ETS in Python, this handles
+        # all cases including symbolic values.  Returns the ETS value, as
+        # the composed transform, and the Jacobian
+        n = self.n
 
-                elif et.axis == 'ty':
-                    J[:3, j] = o
-                    J[3:, j] = np.array([0, 0, 0])
+        # work through the compiled ETS, where runs of constants are
+        # already folded into one transform
+        data = self._compile()
 
-                elif et.axis == 'tz':
-                    J[:3, j] = a
-                    J[3:, j] = np.array([0, 0, 0])
+        # index a list, not an array, so joint values are Python floats
+        symbolic = q.dtype == object
+        q = q.tolist()
 
-                j += 1
-            else:
+        # the joint coordinate used by each joint, as for eval()
+        jindex = self._qindex()
+
+        if soa is not None:
+            # numeric, reuse scratch arrays from the last call
+            if self._jacob0_buf is None:
+                self._jacob0_buf = (
+                    np.empty((4, 4)), np.empty((4, 4)), np.empty((n, 3)))
+            U, U2, P = self._jacob0_buf
+            np.copyto(U, _I4)
+        else:
+            U = np.eye(4)  # SE(3) matrix
+            U2 = None
+
+        if T is None and soa is not None:
+            # find the end-effector position in each joint frame by a
+            # backward pass, then the ETS does not need to be evaluated.
+            # Every row of P is written
+            p = np.zeros(3)
+            i = len(jindex)
+            for et in reversed(data):
+                if et.joint:
+                    i -= 1
+                    P[i] = p
+                    qj = q[jindex[i]]
+                    if et.flip:
+                        qj = -qj
+                    axis_id = et.axis_id
+                    if axis_id <= AXIS_RZ:
+                        a, b = _ROT_COLS[axis_id]
+                        c = math.cos(qj)
+                        s = math.sin(qj)
+                        p[a], p[b] = c * p[a] - s * p[b], s * p[a] + c * p[b]
+                    else:
+                        p[axis_id - AXIS_TX] += qj
+                else:
+                    p = et.T[:3, :3] @ p + et.T[:3, 3]
+        else:
+            if T is None:
+                T = self._eval(q, 'rad')
+            P = None
+
+        i = 0
+        J = np.zeros((6, n))
+
+        for et in data:
+
+            if et.joint:
+                # joint variable
+                j = jindex[i]
+                qj = -q[j] if et.flip else q[j]
+                axis_id = et.axis_id
+                if symbolic:
+                    U = U @ et.axis_func(qj)
+                elif axis_id <= AXIS_RZ:
+                    _UPDATE[axis_id](U, math.cos(qj), math.sin(qj))
+                else:
+                    _UPDATE[axis_id](U, qj)
+
+                if axis_id <= AXIS_RZ:
+                    # end-effector position in the joint frame, the
+                    # translation part of inv(U) @ T, is R' (t_T - t_U)
+                    if P is None:
+                        p = (T[:3, 3] - U[:3, 3]) @ U[:3, :3]
+                    else:
+                        p = P[i]
+
+                    # rotation about column axis_id of U, the linear
+                    # velocity is that axis crossed with the position
+                    a, b = _ROT_COLS[axis_id]
+                    Jv = U[:3, b] * p[a] - U[:3, a] * p[b]
+                    Jw = U[:3, axis_id]
+
+                else:
+                    # translation, no angular velocity
+                    Jv = U[:3, axis_id - AXIS_TX]
+                    Jw = 0
+
+                # a joint coordinate can drive more than one joint, so
+                # accumulate the columns, a flipped joint moves the other way
+                if et.flip:
+                    J[:3, j] -= Jv
+                    J[3:, j] -= Jw
+                else:
+                    J[:3, j] += Jv
+                    J[3:, j] += Jw
+
+                i += 1
+            elif U2 is None:
                 # constant transform
-                U = U @ et.T()
+                U = U @ et.T
+            else:
+                # constant transform, swap between the scratch arrays
+                np.matmul(U, et.T, out=U2)
+                U, U2 = U2, U
 
-        return J
+        return U, J
 
     def jacobe(self, q=None, T=None):
         r"""
@@ -1330,7 +2788,7 @@ class ETS(BaseETS):
         :param q: joint coordinates
         :type q: array_like
         :param T: ETS value as an SE(3) matrix if known
-        :type T: ndarray(4,4)
+        :type T: SE3 instance or ndarray(4,4)
         :return: Jacobian matrix
         :rtype: ndarray(6,n)
 
@@ -1347,9 +2805,13 @@ class ETS(BaseETS):
         """  # noqa
 
         if T is None:
-            T = self.eval(q)
+            # the pose and Jacobian from one walk of the ETS
+            T, J0 = self.jacob0_fused(q)
+            return tr2jac(T.T) @ J0
+        elif not isinstance(T, np.ndarray):
+            T = T.A
 
-        return tr2jac(T.A.T) @ self.jacob0(q, T)
+        return tr2jac(T.T) @ self.jacob0(q, T)
 
     def hessian0(self, q=None, J0=None):
         r"""
@@ -1416,16 +2878,22 @@ class ETS(BaseETS):
         else:
             verifymatrix(J0, (6, n))
 
-        H = np.zeros((6, n, n))
-
-        for j in range(n):
-            for i in range(j, n):
+        # all the cross products at once, element [i, j] of the (n,n,3)
+        # arrays is w_j x v_i and w_j x w_i respectively
+        w = J0[3:, :].T
+        v = J0[:3, :].T
+        Hv = np.cross(w[np.newaxis, :, :], v[:, np.newaxis, :])
+        Hw = np.cross(w[np.newaxis, :, :], w[:, np.newaxis, :])
 
-                H[:3, i, j] = np.cross(J0[3:, j], J0[:3, i])
-                H[3:, i, j] = np.cross(J0[3:, j], J0[3:, i])
+        # only i >= j is computed, the translational part is symmetric and
+        # the rotational part is zero above the diagonal
+        lower = np.tri(n, dtype=bool)[:, :, np.newaxis]
+        Hv = np.where(lower, Hv, Hv.transpose((1, 0, 2)))
+        Hw = np.where(lower, Hw, 0)
 
-                if i != j:
-                    H[:3, j, i] = H[:3, i, j]
+        H = np.zeros((6, n, n))
+        H[:3] = Hv.transpose((2, 0, 1))
+        H[3:] = Hw.transpose((2, 0, 1))
 
         return H
 
@@ -1513,9 +2981,20 @@ class ETS2(BaseETS):
 
         :seealso: :func:`ETS`, :func:`isrotation`
         """
+        def axis_func(theta):
+            if issymbol(theta):
+                return trot2(theta)
+            c = math.cos(theta)
+            s = math.sin(theta)
+            T = _I3.copy()
+            T[0, 0] = c
+            T[0, 1] = -s
+            T[1, 0] = s
+            T[1, 1] = c
+            return T
+
         return cls(
-            axis='R', eta=eta,
-            axis_func=lambda theta: trot2(theta), unit=unit, **kwargs)
+            axis='R', eta=eta, axis_func=axis_func, unit=unit, **kwargs)
 
     @classmethod
     def tx(cls, eta=None, **kwargs):
@@ -1539,9 +3018,11 @@ class ETS2(BaseETS):
 
         :seealso: :func:`ETS`, :func:`istranslation`
         """
-        return cls(
-            axis='tx', eta=eta,
-            axis_func=lambda x: transl2(x, 0), **kwargs)
+        # this method is faster than using lambda x: transl2(x, 0)
+        def axis_func(x):
+            return _transl(_I3, 0, x)
+
+        return cls(axis='tx', eta=eta, axis_func=axis_func, **kwargs)
 
     @classmethod
     def ty(cls, eta=None, **kwargs):
@@ -1565,61 +3046,48 @@ class ETS2(BaseETS):
 
         :seealso: :func:`ETS`
         """
-        return cls(
-            axis='ty', eta=eta,
-            axis_func=lambda y: transl2(0, y), **kwargs)
+        # this method is faster than using lambda y: transl2(0, y)
+        def axis_func(y):
+            return _transl(_I3, 1, y)
+
+        return cls(axis='ty', eta=eta, axis_func=axis_func, **kwargs)
 
     def jacob0(self, q, T=None):
 
-        # very inefficient implementation, just put a 1 in last row
-        # if its a rotation joint
+        # walk the compiled ETS, the joint indices are looked up rather than
+        # written to the ETs, which may be shared with other ETS
         q = getvector(q)
+        n = self.n
+        self._check_nq(len(q))
+        self._check_nq(n)  # each joint index is a column of J
 
-        # E = np.zeros((3, 3))
-        j = 0
-        J = np.zeros((3, self.n))
-        etjoints = self.joints()
-
-        if not all([self[i].jindex for i in etjoints]):
-            # not all joints have a jindex it is required, set them
-            for j in range(self.n):
-                i = etjoints[j]
-                self[i].jindex = j
-
-        for j in range(self.n):
-            i = etjoints[j]
-
-            axis = self[i].axis
-            if axis == 'R':
-                dTdq = np.array([
-                    [0, -1, 0],
-                    [1,  0, 0],
-                    [0,  0, 0]
-                ]) @ self[i].eval(q).A  
-            elif axis == 'tx':
-                dTdq = np.array([
-                    [0, 0, 1],
-                    [0, 0, 0],
-                    [0, 0, 0]
-                ])
-            elif axis == 'ty':
-                dTdq = np.array([
-                    [0, 0, 0],
-                    [0, 0, 1],
-                    [0, 0, 0]
-                ])
-
-            E0 = self[:i]
-            if len(E0) > 0:
-                dTdq = E0.eval(q).A @ dTdq
-
-            Ef = self[i+1:]
-            if len(Ef) > 0:
-                dTdq = dTdq @ Ef.eval(q).A
-
-            T = self.eval(q).A
-            dRdt = dTdq[:2, :2] @ T[:2, :2].T
-            J[:, j] = np.r_[dTdq[:2, 2].T, dRdt[1, 0]]
+        if T is None:
+            T = self.eval_array(q)
+        elif not isinstance(T, np.ndarray):
+            T = T.A
+
+        J = np.zeros((3, n))
+        U = np.eye(3)
+        qindex = iter(self._qindex())
+        for et in self._compile():
+            if not et.joint:
+                U = U @ et.T
+                continue
+            k = next(qindex)
+            qk = -q[k] if et.flip else q[k]
+            U = U @ et.axis_func(qk)
+
+            # a flipped joint moves the other way
+            f = -1 if et.flip else 1
+            if et.axis_id == AXIS_RZ:
+                # rotation, the linear velocity is the z-axis crossed with
+                # the end-effector position relative to the joint
+                J[0, k] -= f * (T[1, 2] - U[1, 2])
+                J[1, k] += f * (T[0, 2] - U[0, 2])
+                J[2, k] += f
+            else:
+                # translation along a column of U
+                J[:2, k] += f * U[:2, et.axis_id - AXIS_TX]
 
         return J
 
@@ -1629,8 +3097,8 @@ class ETS2(BaseETS):
 
         :param q: joint coordinates
         :type q: array_like
-        :param T: ETS value as an SE(3) matrix if known
-        :type T: ndarray(4,4)
+        :param T: ETS value as an SE(2) matrix if known
+        :type T: SE2 instance or ndarray(3,3)
         :return: Jacobian matrix
         :rtype: ndarray(6,n)
 
@@ -1647,9 +3115,11 @@ class ETS2(BaseETS):
         """  # noqa
 
         if T is None:
-            T = self.eval(q)
+            T = self._eval(q, 'rad')
+        elif not isinstance(T, np.ndarray):
+            T = T.A
 
-        return tr2jac2(T.A.T) @ self.jacob0(q, T)
+        return tr2jac2(T.T) @ self.jacob0(q, T)
 
 
 if __name__ == "__main__":
@@ -33,6 +33,14 @@ vp_req = [
     'imageio-ffmpeg'
 ]
 
+numba_req = [
+    'numba'
+]
+
+jax_req = [
+    'jax'
+]
+
 dev_req = [
     'pytest',
     'pytest-cov',
@@ -155,6 +163,8 @@ setup(
         'collision': collision_req,
         'dev': dev_req,
         'docs': docs_req,
+        'jax': jax_req,
+        'numba': numba_req,
         'vpython': vp_req
     }
 )
@@ -6,9 +6,11 @@ Created on Fri May 1 14:04:04 2020
 """
 
 import numpy.testing as nt
+import numpy as np
 import roboticstoolbox as rp
 import spatialmath.base as sm
 import unittest
+import importlib
 
 
 class TestETS(unittest.TestCase):
@@ -82,6 +84,28 @@ class TestETS(unittest.TestCase):
         self.assertEqual(str(ty), repr(ty))
         self.assertEqual(str(tz), repr(tz))
 
+    def test_str_cache(self):
+        e = rp.ETS.rz() * rp.ETS.tx(1)
+        self.assertEqual(str(e), 'Rz(q) \u2295 tx(1)')
+        self.assertEqual(str(e), 'Rz(q) \u2295 tx(1)')
+
+        e *= rp.ETS.rz()
+        self.assertEqual(str(e), 'Rz(q0) \u2295 tx(1) \u2295 Rz(q1)')
+        self.assertEqual(
+            e.__str__("θ{1}"), 'Rz(θ1) \u2295 tx(1) \u2295 Rz(θ2)')
+        self.assertEqual(str(e), 'Rz(q0) \u2295 tx(1) \u2295 Rz(q1)')
+
+        tx = rp.ETS.tx(1)
+        self.assertEqual(str(tx), 'tx(1)')
+        tx.eta = 2
+        self.assertEqual(str(tx), 'tx(2)')
+
+        # changed through a view, which shares the ET namespaces
+        e = rp.ETS.rz() * rp.ETS.tx(1)
+        self.assertEqual(str(e), 'Rz(q) \u2295 tx(1)')
+        e[1].eta = 2
+        self.assertEqual(str(e), 'Rz(q) \u2295 tx(2)')
+
     def test_str_q(self):
         rx = rp.ETS.rx()
         ry = rp.ETS.ry()
@@ -147,6 +171,497 @@ class TestETS(unittest.TestCase):
         nt.assert_array_almost_equal(ets[0].T(1), sm.trotx(1))
         nt.assert_array_almost_equal(ets[1].T(2), sm.transl(2, 0, 0))
 
+    def test_eval(self):
+        ets = rp.ETS.tz(0.3) * rp.ETS.rz() * rp.ETS.tx(0.2) \
+            * rp.ETS.ry(flip=True) * rp.ETS.ty()
+        q = [0.1, 0.2, 0.3]
+
+        T = sm.transl(0, 0, 0.3) @ sm.trotz(0.1) @ sm.transl(0.2, 0, 0) \
+            @ sm.troty(-0.2) @ sm.transl(0, 0.3, 0)
+
+        nt.assert_array_almost_equal(ets.eval(q).A, T)
+        nt.assert_array_almost_equal(
+            ets.eval(np.r_[np.rad2deg(q[:2]), q[2]], unit='deg').A, T)
+
+        # one coordinate for a rotation and a translation
+        ets = rp.ETS.rz(j=0) * rp.ETS.tx(j=0)
+        nt.assert_array_almost_equal(
+            ets.eval([30], unit='deg').A,
+            sm.trotz(30, 'deg') @ sm.transl(30, 0, 0))
+
+        # constant only
+        ets = rp.ETS.tz(0.3) * rp.ETS.rx(0.2)
+        nt.assert_array_almost_equal(
+            ets.eval().A, sm.transl(0, 0, 0.3) @ sm.trotx(0.2))
+
+    def test_eval_short_q(self):
+        ets = rp.ETS.rz() * rp.ETS.tx(1) * rp.ETS.rz() * rp.ETS.tx(1)
+        with self.assertRaises(ValueError):
+            ets.eval([0.3])
+        with self.assertRaises(ValueError):
+            ets.eval_array()
+
+        ets = rp.ETS.rz(j=2) * rp.ETS.tx(1) * rp.ETS.rx(j=0)
+        with self.assertRaises(ValueError):
+            ets.eval([0.1, 0.2])
+        ets.eval([0.1, 0.2, 0.3])
+
+    def test_eval_batch(self):
+        ets = rp.ETS.tz(0.3) * rp.ETS.rz() * rp.ETS.tx(0.2) \
+            * rp.ETS.ry(flip=True) * rp.ETS.ty() * rp.ETS.rx(j=0)
+        Q = np.random.rand(5, 3)
+
+        T = ets.eval_batch(Q)
+        self.assertEqual(T.shape, (5, 4, 4))
+        for Tk, q in zip(T, Q):
+            nt.assert_array_almost_equal(Tk, ets.eval(q).A)
+
+        T = ets.eval_batch(Q * 90, 'deg')
+        for Tk, q in zip(T, Q):
+            nt.assert_array_almost_equal(Tk, ets.eval(q * 90, 'deg').A)
+
+        e2 = rp.ETS2.r() * rp.ETS2.tx(1) * rp.ETS2.r(0.3) \
+            * rp.ETS2.ty(flip=True)
+        Q = np.random.rand(5, 2)
+        T = e2.eval_batch(Q)
+        self.assertEqual(T.shape, (5, 3, 3))
+        for Tk, q in zip(T, Q):
+            nt.assert_array_almost_equal(Tk, e2.eval(q).A)
+
+        T = e2.eval_batch(Q, dtype=np.float32)
+        self.assertEqual(T.dtype, np.float32)
+        nt.assert_array_almost_equal(T, e2.eval_batch(Q), decimal=5)
+
+        Q = np.random.rand(5, 3)
+        T = ets.eval_batch(Q, dtype=np.float32)
+        self.assertEqual(T.dtype, np.float32)
+        nt.assert_array_almost_equal(T, ets.eval_batch(Q), decimal=5)
+
+        for dtype in (int, np.float16, np.longdouble, complex):
+            with self.assertRaises(ValueError):
+                ets.eval_batch(Q, dtype=dtype)
+
+        with self.assertRaises(ValueError):
+            ets.eval_batch(Q[:, :2])
+
+    def test_eval_ets2(self):
+        e = rp.ETS2.tx(0.5) * rp.ETS2.r(0.2) * rp.ETS2.r(j=1) \
+            * rp.ETS2.tx(1) * rp.ETS2.ty(j=0, flip=True) * rp.ETS2.r(0.1)
+        q = [0.3, 0.4]
+        nt.assert_array_almost_equal(
+            e.eval(q).A,
+            sm.transl2(0.5, 0) @ sm.trot2(0.2) @ sm.trot2(0.4)
+            @ sm.transl2(1, 0) @ sm.transl2(0, -0.3) @ sm.trot2(0.1))
+        nt.assert_array_almost_equal(
+            e.eval([0.3, 40], 'deg').A,
+            sm.transl2(0.5, 0) @ sm.trot2(0.2) @ sm.trot2(40, "deg")
+            @ sm.transl2(1, 0) @ sm.transl2(0, -0.3) @ sm.trot2(0.1))
+
+        # too few joint coordinates for the jitted SE(2) kernels
+        with self.assertRaises(ValueError):
+            e.eval([0.3])
+        with self.assertRaises(ValueError):
+            e.eval_array()
+        with self.assertRaises(ValueError):
+            e.eval_batch([[0.3], [0.4]])
+
+    def test_eval_memo(self):
+        e = rp.ETS2.r() * rp.ETS2.tx(1) * rp.ETS2.r(flip=True)
+
+        for q in ([0.1, 0.2], [0.1, 0.3], [0.1, 0.3], [0.4, 0.3]):
+            nt.assert_array_almost_equal(
+                e.eval(q).A,
+                sm.trot2(q[0]) @ sm.transl2(1, 0) @ sm.trot2(-q[1]))
+
+        T = e[0].eval_array([0.4])
+        T[0, 2] = 99
+        nt.assert_array_almost_equal(e[0].eval_array([0.4]), sm.trot2(0.4))
+
+    def test_eta_set(self):
+        e = rp.ETS.rx(0.2)
+        nt.assert_array_almost_equal(e.eval().A, sm.trotx(0.2))
+
+        e.eta = 0.5
+        nt.assert_array_almost_equal(e.T(), sm.trotx(0.5))
+        nt.assert_array_almost_equal(e.eval().A, sm.trotx(0.5))
+
+        # through a view, the namespace is shared with the parent ETS
+        e = rp.ETS.rz() * rp.ETS.tx(1) * rp.ETS.ty(1)
+        self.assertEqual(len(e.compile()), 2)
+        self.assertIsNotNone(e._pack())
+        e[1].eta = 2
+        e[2].eta = 0
+        comp = e.compile()
+        self.assertEqual(len(comp), 2)
+        self.assertEqual(comp[1].axis, 'tx')
+        self.assertAlmostEqual(comp[1].eta, 2)
+        nt.assert_array_almost_equal(e._pack()[3][0], sm.transl(2, 0, 0))
+
+        # an unchanged value, or a change to another ETS, keeps the caches
+        soa = e._pack()
+        e[1].eta = 2
+        self.assertIs(e._pack(), soa)
+        other = rp.ETS.tx(1) * rp.ETS.rz()
+        other[0].eta = 3
+        self.assertIs(e._pack(), soa)
+
+    def test_joints(self):
+        ets = rp.ETS.rz() * rp.ETS.tx(1) * rp.ETS.rz() * rp.ETS.tz()
+
+        nt.assert_array_equal(ets.joints(), [0, 2, 3])
+        self.assertEqual(ets.n, 3)
+
+        ets.pop()
+        nt.assert_array_equal(ets.joints(), [0, 2])
+        self.assertEqual(ets.n, 2)
+
+        ets.insert(0, rp.ETS.ry())
+        nt.assert_array_equal(ets.joints(), [0, 1, 3])
+        self.assertEqual(ets.n, 3)
+
+    def test_compile(self):
+        ets = rp.ETS.tz(0.3) * rp.ETS.rx(0.2) * rp.ETS.rz() \
+            * rp.ETS.tx(0.2) * rp.ETS.ty(0.1) * rp.ETS.ry() * rp.ETS.tz(0.1)
+        comp = ets.compile()
+        q = [0.3, 0.4]
+
+        self.assertEqual(len(comp), 5)
+        self.assertEqual(comp.n, 2)
+        nt.assert_array_almost_equal(comp.eval(q).A, ets.eval(q).A)
+
+    def test_compile_same_axis(self):
+        ets = rp.ETS.rz(0.2) * rp.ETS.rz(0.3) * rp.ETS.rx() \
+            * rp.ETS.tz(1) * rp.ETS.tz(-1) * rp.ETS.ry() * rp.ETS.tx(0.5)
+        comp = ets.compile()
+        q = [0.3, 0.4]
+
+        self.assertEqual(len(comp), 4)
+        self.assertEqual(comp[0].axis, 'Rz')
+        self.assertAlmostEqual(comp[0].eta, 0.5)
+        self.assertEqual(comp[3].axis, 'tx')
+        nt.assert_array_almost_equal(comp.eval(q).A, ets.eval(q).A)
+
+    def test_compile_const(self):
+        ets = rp.ETS.rx() * rp.ETS._CONST(np.eye(4)) * rp.ETS.tx(0.3) \
+            * rp.ETS._CONST(sm.transl(0, 0, 1)) \
+            * rp.ETS._CONST(sm.trotx(0.2)) * rp.ETS.rz() \
+            * rp.ETS._CONST(np.eye(4))
+        comp = ets.compile()
+        q = [0.3, 0.4]
+
+        # no adjacent constants survive, identities are dropped
+        self.assertEqual(len(comp), 3)
+        self.assertEqual(comp[0].axis, 'Rx')
+        self.assertEqual(comp[1].axis, 'C')
+        self.assertEqual(comp[2].axis, 'Rz')
+        nt.assert_array_almost_equal(comp.eval(q).A, ets.eval(q).A)
+
+        comp = (rp.ETS.rx() * rp.ETS._CONST(np.eye(4))
+                * rp.ETS.tx(0.3)).compile()
+        self.assertEqual(len(comp), 2)
+        self.assertEqual(comp[1].axis, 'tx')
+
+    def test_compile_ets2(self):
+        ets = rp.ETS2.r(0.1) * rp.ETS2.tx(1) * rp.ETS2.r() \
+            * rp.ETS2.tx(1) * rp.ETS2.tx(2)
+        comp = ets.compile()
+
+        self.assertIsInstance(comp, rp.ETS2)
+        self.assertEqual(len(comp), 3)
+        self.assertTrue(comp[0].isconstant)
+        self.assertEqual(comp[2].axis, 'tx')
+        nt.assert_array_almost_equal(comp.eval([0.3]).A, ets.eval([0.3]).A)
+
+        nt.assert_array_almost_equal(
+            (rp.ETS2.tx(1) * rp.ETS2.tx(-1)).eval().A, np.eye(3))
+
+    def test_structure(self):
+        ets = rp.ETS.tz() * rp.ETS.tx(1) * rp.ETS.rz() * rp.ETS.ty()
+        self.assertEqual(ets.structure, 'PRP')
+        e = ets * rp.ETS.rx()
+        self.assertEqual(e.structure, 'PRPR')
+        e.pop()
+        self.assertEqual(e.structure, 'PRP')
+
+        self.assertTrue(ets[0].istranslation)
+        self.assertFalse(ets[0].isrotation)
+        self.assertTrue(ets[2].isrotation)
+        self.assertFalse(ets[2].isconstant)
+        self.assertTrue(rp.ETS._CONST(np.eye(4) * 2).isconstant)
+        nt.assert_array_almost_equal(ets[2].s, [0, 0, 0, 0, 0, 1])
+        nt.assert_array_almost_equal(ets[3].s, [0, 1, 0, 0, 0, 0])
+
+    def test_eval_symbolic(self):
+        ets = rp.ETS.rz() * rp.ETS.tx(1) * rp.ETS.rz(flip=True) \
+            * rp.ETS.tz(j=3)
+        subs, T = ets.eval_symbolic()
+
+        self.assertEqual(T.shape, (4, 4))
+        q = [0.1, 0.2, 0, 0.4]
+        vals = dict(zip(sm.symbol('q0:4'), q))
+        for x, e in subs:
+            vals[x] = e.subs(vals)
+        nt.assert_array_almost_equal(
+            np.array(T.subs(vals), dtype=float), ets.eval(q).A)
+
+        f = ets.lambdify()
+        nt.assert_array_almost_equal(f(q), ets.eval(q).A)
+
+        f = (rp.ETS2.r() * rp.ETS2.tx(1)).lambdify('deg')
+        nt.assert_array_almost_equal(
+            f([30]), sm.trot2(30, 'deg') @ sm.transl2(1, 0))
+
+    def test_eval_jax(self):
+        try:
+            import jax
+        except ImportError:
+            self.skipTest('JAX is not installed')
+
+        ets = rp.ETS.tz(0.3) * rp.ETS.rz(j=1) * rp.ETS.tx(0.2) \
+            * rp.ETS.ry(flip=True) * rp.ETS.ty(j=0)
+        q = np.array([0.1, 0.2, 0.3])
+
+        nt.assert_array_almost_equal(
+            np.array(ets.eval_jax(q)), ets.eval(q).A, decimal=5)
+        nt.assert_array_almost_equal(
+            np.array(ets.eval_jax(q * 90, 'deg')),
+            ets.eval(q * 90, 'deg').A, decimal=5)
+
+        T = jax.vmap(ets.eval_jax)(np.tile(q, (4, 1)))
+        self.assertEqual(T.shape, (4, 4, 4))
+
+        with self.assertRaises(ValueError):
+            ets.eval_jax([0.3])
+        with self.assertRaises(ValueError):
+            (rp.ETS.rz() * rp.ETS.tx(1) * rp.ETS.rz()).eval_jax([0.3])
+        with self.assertRaises(ValueError):
+            jax.vmap(ets.eval_jax)(np.zeros((4, 1)))
+
+    def test_generate_python(self):
+        ets = rp.ETS.tz(0.3) * rp.ETS.rz() * rp.ETS.tx(0.2) \
+            * rp.ETS.ry(flip=True) * rp.ETS.ty()
+        q = [0.1, 0.2, 0.3]
+
+        namespace = {}
+        exec(ets.generate_python('myfk'), namespace)
+        nt.assert_array_almost_equal(namespace['myfk'](q), ets.eval(q).A)
+
+        namespace = {}
+        exec(ets.generate_python(unit='deg'), namespace)
+        nt.assert_array_almost_equal(
+            namespace['fk']([10, 20, 0.3]), ets.eval([10, 20, 0.3], 'deg').A)
+
+    def test_compile_eval_shared(self):
+        ets1 = rp.ETS.tz(0.3) * rp.ETS.rz() * rp.ETS.tx(0.2) * rp.ETS.ry()
+        ets2 = rp.ETS.tz(0.3) * rp.ETS.rz() * rp.ETS.tx(0.2) * rp.ETS.ry()
+        ets3 = rp.ETS.tz(0.4) * rp.ETS.rz() * rp.ETS.tx(0.2) * rp.ETS.ry()
+
+        self.assertIs(ets1._compile_eval(), ets2._compile_eval())
+        self.assertIsNot(ets1._compile_eval(), ets3._compile_eval())
+        self.assertIsNot(ets1._compile_eval(), ets1._compile_eval('deg'))
+
+        q = [0.3, 0.4]
+        nt.assert_array_almost_equal(ets1._compile_eval()(q), ets2.eval(q).A)
+
+        # the signature follows a joint index changed through a view
+        e = rp.ETS.tx(j=0) * rp.ETS.ty(j=1)
+        nt.assert_array_almost_equal(
+            e._compile_eval()([1, 2])[:3, 3], [1, 2, 0])
+        e[0].jindex = 1
+        e[1].jindex = 0
+        nt.assert_array_almost_equal(
+            e._compile_eval()([1, 2])[:3, 3], [2, 1, 0])
+
+    def test_jacob0_flip_jindex(self):
+        ets = rp.ETS.rz(j=1) * rp.ETS.tx(1) * rp.ETS.rz(j=0, flip=True) \
+            * rp.ETS.tx(1)
+        q = [0.2, 0.5]
+        J = ets.jacob0(q)
+
+        # same as an ETS with the joints in coordinate order
+        ets2 = rp.ETS.rz() * rp.ETS.tx(1) * rp.ETS.rz() * rp.ETS.tx(1)
+        J2 = ets2.jacob0([q[1], -q[0]])
+
+        nt.assert_array_almost_equal(J[:, 0], -J2[:, 1])
+        nt.assert_array_almost_equal(J[:, 1], J2[:, 0])
+        nt.assert_array_almost_equal(ets.jacob0(q, T=ets.eval(q)), J)
+
+        # a joint index beyond the Jacobian columns
+        ets = rp.ETS.rz(j=2) * rp.ETS.tx(1) * rp.ETS.rx(j=3)
+        with self.assertRaises(ValueError):
+            ets.jacob0([1, 2])
+
+    def test_jacob0_ets2(self):
+        e = rp.ETS2.tx(0.5) * rp.ETS2.r() * rp.ETS2.tx(1) \
+            * rp.ETS2.r(flip=True) * rp.ETS2.ty() * rp.ETS2.r(0.2)
+        q = np.r_[0.3, 0.4, 0.2]
+        J = e.jacob0(q)
+
+        # finite differences of x, y and the angle
+        def f(q):
+            T = e.eval_array(q)
+            return np.r_[T[:2, 2], np.arctan2(T[1, 0], T[0, 0])]
+
+        Jn = np.zeros((3, 3))
+        for j in range(3):
+            dq = np.zeros(3)
+            dq[j] = 1e-7
+            Jn[:, j] = (f(q + dq) - f(q - dq)) / 2e-7
+        nt.assert_array_almost_equal(J, Jn)
+
+        # the ETs are not changed, nor the cached values of other ETS
+        self.assertIsNone(e[1].jindex)
+        ets_module = importlib.import_module('roboticstoolbox.robot.ETS')
+        gen = ets_module._generation
+        e.jacob0(q)
+        self.assertEqual(ets_module._generation, gen)
+
+    def test_jacob0_fused(self):
+        ets = rp.ETS.tz(0.3) * rp.ETS.rz() * rp.ETS.tx(0.2) * rp.ETS.ry() \
+            * rp.ETS.tz(flip=True) * rp.ETS.rx(0.1)
+        q = [0.3, -0.4, 0.2]
+
+        T, J = ets.jacob0_fused(q)
+        nt.assert_array_almost_equal(T, ets.eval(q).A)
+        nt.assert_array_almost_equal(J, ets.jacob0(q))
+
+        # starting with a joint
+        ets = rp.ETS.rz() * rp.ETS.tx(1) * rp.ETS.rz()
+        T, J = ets.jacob0_fused([0.1, 0.2])
+        nt.assert_array_almost_equal(T, ets.eval([0.1, 0.2]).A)
+        nt.assert_array_almost_equal(J, ets.jacob0([0.1, 0.2]))
+        nt.assert_array_almost_equal(
+            ets.jacobe([0.1, 0.2]), ets.jacobe([0.1, 0.2], T=T))
+
+        with self.assertRaises(ValueError):
+            (rp.ETS.rz(j=1) * rp.ETS.tx(1)).jacob0_fused([0.1])
+
+    def test_imul(self):
+        e = rp.ETS.rz() * rp.ETS.tx(1)
+        e0 = e
+        q = [0.1, 0.2]
+        nt.assert_array_almost_equal(
+            e.eval(q[:1]).A, sm.trotz(0.1) @ sm.transl(1, 0, 0))
+
+        e *= rp.ETS.rz()
+        self.assertIs(e, e0)
+        self.assertEqual(len(e), 3)
+        self.assertEqual(e.n, 2)
+        nt.assert_array_almost_equal(
+            e.eval(q).A, sm.trotz(0.1) @ sm.transl(1, 0, 0) @ sm.trotz(0.2))
+
+        e.extend(rp.ETS.tx(2))
+        self.assertEqual(e.structure, 'RR')
+        nt.assert_array_almost_equal(
+            e.eval(q).A, sm.trotz(0.1) @ sm.transl(1, 0, 0) @ sm.trotz(0.2)
+            @ sm.transl(2, 0, 0))
+
+    def test_qindex(self):
+        ets = rp.ETS.rz(j=2) * rp.ETS.tx(1) * rp.ETS.rx(j=0) \
+            * rp.ETS.ty(j=2)
+        self.assertEqual(ets._qindex(), (2, 0, 2))
+        codes, jindex, _, _ = ets._pack()
+        self.assertEqual(list(jindex[codes != 6]), [2, 0, 2])
+        self.assertEqual(
+            [term[1] for term in ets._signature()
+                if not isinstance(term, bytes)],
+            [2, 0, 2])
+        self.assertEqual(len(ets._qsymbols()), 3)
+
+    def test_mutate(self):
+        q = [0.3, 0.4]
+
+        e = rp.ETS.rx() * rp.ETS.rz()
+        e.eval(q)
+        del e[0]
+        self.assertEqual(e.n, 1)
+        self.assertEqual(str(e), 'Rz(q)')
+        nt.assert_array_almost_equal(e.eval([0.3]).A, sm.trotz(0.3))
+
+        e = rp.ETS.rz() * rp.ETS.tx(1)
+        nt.assert_array_almost_equal(
+            e.eval([0.5]).A[:3, 3], [0.877583, 0.479426, 0])
+        e.reverse()
+        nt.assert_array_almost_equal(e.eval([0.5]).A[:3, 3], [1, 0, 0])
+        self.assertEqual(str(e), 'tx(1) \u2295 Rz(q)')
+
+        e = rp.ETS.rz() * rp.ETS.tx(1) * rp.ETS.rz()
+        e.eval(q)
+        e[1] = rp.ETS.ty(2)
+        self.assertEqual(str(e), 'Rz(q0) \u2295 ty(2) \u2295 Rz(q1)')
+        nt.assert_array_almost_equal(
+            e.eval(q).A, sm.trotz(0.3) @ sm.transl(0, 2, 0) @ sm.trotz(0.4))
+        e[1:] = rp.ETS.tz(1)
+        self.assertEqual(e.n, 1)
+        nt.assert_array_almost_equal(
+            e.eval([0.3]).A, sm.trotz(0.3) @ sm.transl(0, 0, 1))
+
+        e.append(rp.ETS.rx())
+        self.assertEqual(e.n, 2)
+        nt.assert_array_almost_equal(
+            e.eval(q).A, sm.trotz(0.3) @ sm.transl(0, 0, 1) @ sm.trotx(0.4))
+        e.remove(e[0])
+        self.assertEqual(str(e), 'tz(1) \u2295 Rx(q)')
+        with self.assertRaises(ValueError):
+            e.remove(rp.ETS.rx())
+
+        e.clear()
+        self.assertEqual(e.n, 0)
+        self.assertEqual(str(e), '')
+        nt.assert_array_almost_equal(e.eval().A, np.eye(4))
+
+    def test_eval_cache(self):
+        ets = rp.ETS.rz() * rp.ETS.tx(1) * rp.ETS.rz()
+        q = [0.1, 0.2]
+
+        T = ets.eval(q)
+        T.A[0, 3] = 99
+        nt.assert_array_almost_equal(
+            ets.eval(q).A, sm.trotz(0.1) @ sm.transl(1, 0, 0) @ sm.trotz(0.2))
+
+        ets.pop()
+        nt.assert_array_almost_equal(
+            ets.eval(q[:1]).A, sm.trotz(0.1) @ sm.transl(1, 0, 0))
+
+        # changed through a view, which shares the ET namespaces
+        e = rp.ETS.rz() * rp.ETS.tx(1)
+        nt.assert_array_almost_equal(e.eval([0]).A[:3, 3], [1, 0, 0])
+        e[1].eta = 2
+        nt.assert_array_almost_equal(e.eval([0]).A[:3, 3], [2, 0, 0])
+
+        e = rp.ETS.tx(j=0) * rp.ETS.ty(j=1)
+        nt.assert_array_almost_equal(e.eval([1, 2]).A[:3, 3], [1, 2, 0])
+        e[0].jindex = 1
+        e[1].jindex = 0
+        nt.assert_array_almost_equal(e.eval([1, 2]).A[:3, 3], [2, 1, 0])
+
+    def test_eval_array(self):
+        ets = rp.ETS.rz() * rp.ETS.tx(1) * rp.ETS.rz()
+        q = [0.1, 0.2]
+
+        T = ets.eval_array(q)
+        self.assertIsInstance(T, np.ndarray)
+        nt.assert_array_almost_equal(T, ets.eval(q).A)
+
+        T[0, 3] = 99
+        nt.assert_array_almost_equal(ets.eval_array(q), ets.eval(q).A)
+
+        e2 = rp.ETS2.r() * rp.ETS2.tx(1)
+        nt.assert_array_almost_equal(
+            e2.eval_array([0.3]), sm.trot2(0.3) @ sm.transl2(1, 0))
+
+    def test_axis_id(self):
+        module = importlib.import_module('roboticstoolbox.robot.ETS')
+
+        self.assertEqual(rp.ETS.rx().axis_id, module.AXIS_RX)
+        self.assertEqual(rp.ETS.ry(1).axis_id, module.AXIS_RY)
+        self.assertEqual(rp.ETS.rz().axis_id, module.AXIS_RZ)
+        self.assertEqual(rp.ETS.tx().axis_id, module.AXIS_TX)
+        self.assertEqual(rp.ETS.ty(1).axis_id, module.AXIS_TY)
+        self.assertEqual(rp.ETS.tz().axis_id, module.AXIS_TZ)
+        self.assertEqual(
+            (rp.ETS.tx(1) * rp.ETS.rx(1)).compile().axis_id, module.AXIS_C)
+
 
 if __name__ == '__main__':
 
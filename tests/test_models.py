@@ -35,6 +35,14 @@ class TestModels(unittest.TestCase):
         frankie.qr
         frankie.qz
 
+    def test_Panda_independent(self):
+        p1 = rp.models.ETS.Panda()
+        p2 = rp.models.ETS.Panda()
+        p1.links[0].ets()[0].eta = 0.5
+        self.assertAlmostEqual(p2.links[0].ets()[0].eta, 0.333)
+        nt.assert_array_almost_equal(
+            p2.fkine(p2.qz).t, rp.models.ETS.Panda().fkine(p2.qz).t)
+
     def test_PandaURDF(self):
         panda = rp.models.Panda()
         panda.qr
@@ -140,6 +148,16 @@ class TestModels(unittest.TestCase):
         r = rp.models.DH.IRB140()
         r.qz
 
+    def test_get_irb140(self):
+        r = rp.models.DH.get_irb140()
+        self.assertIsInstance(r, rp.models.DH.IRB140)
+        self.assertIs(r, rp.models.DH.get_irb140())
+
+    def test_get_panda(self):
+        r = rp.models.ETS.get_panda()
+        self.assertIsInstance(r, rp.models.ETS.Panda)
+        self.assertIs(r, rp.models.ETS.get_panda())
+
     def test_cobra600(self):
         r = rp.models.DH.Cobra600()
         r.qz